@@ -9,21 +9,26 @@ from pathlib import Path
 # Configurações do pytest
 pytest_plugins = []
 
+# Diretório base dos caminhos de teste (calculado uma única vez por processo)
+_ROOT = Path(__file__).resolve().parent
+
 
 def pytest_configure(config):
     """Configuração do pytest"""
-    # Adicionar src ao path
-    src_path = Path(__file__).parent.parent / "src"
-    sys.path.insert(0, str(src_path))
+    # Adicionar src ao path (normalmente já feito via `pythonpath` no
+    # pytest.ini; evita invalidar os caches de importação)
+    src_path = str(_ROOT / "src")
+    if src_path not in sys.path:
+        sys.path.insert(0, src_path)
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_data_path():
     """Fixture que retorna o caminho para dados de teste"""
-    return Path(__file__).parent.parent / "samples"
+    return _ROOT / "samples"
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def exports_path():
     """Fixture que retorna o caminho para exports"""
-    return Path(__file__).parent.parent / "exports"
+    return _ROOT / "exports"
@@ -12,30 +12,221 @@ Exemplos de uso:
 """
 
 import argparse
+import contextlib
+import importlib.util
 import json
+import os
+import re
 import sys
+import time
+import uuid
+import zlib
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Dict, Any, Optional
+from typing import Dict, Any, List, Optional, Tuple
 
-try:
-    import requests
-except ImportError:
+# requests e aiohttp só são importados quando um cliente é criado: a
+# importação custa centenas de ms e comandos como --create-samples não
+# acessam a rede. Aqui apenas verificamos se estão instalados.
+if importlib.util.find_spec("requests") is None:
     print("❌ Requests não está instalado. Execute: pip install requests")
     sys.exit(1)
 
+# aiohttp é opcional: permite disparar requisições independentes em paralelo
+AIOHTTP_AVAILABLE = importlib.util.find_spec("aiohttp") is not None
+
+# aiofiles é opcional: leitura dos uploads sem bloquear o event loop
+AIOFILES_AVAILABLE = importlib.util.find_spec("aiofiles") is not None
+
+# orjson é opcional: serialização/parsing em C para respostas grandes
+try:
+    import orjson
+
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+_json_loads = orjson.loads if ORJSON_AVAILABLE else json.loads
+
+# Palavras no nome do arquivo que identificam um log de firewall
+FIREWALL_TOKENS = frozenset({"firewall", "fw"})
+_FILENAME_TOKEN_RE = re.compile(r"[^a-z0-9]+")
+
+# Tamanho dos blocos usados no upload de logs (em MB)
+UPLOAD_CHUNK_SIZE = int(os.getenv("LOG_ANALYZER_UPLOAD_CHUNK_MB", "8")) * 1024 * 1024
+
+
+def _read_chunks(
+    file_obj, chunk_size: int = UPLOAD_CHUNK_SIZE, max_bytes: Optional[int] = None
+):
+    """
+    Lê um arquivo em blocos de tamanho fixo.
+
+    Com ``max_bytes``, a leitura para ao atingir o limite, completando a linha
+    corrente para não enviar um registro pela metade.
+    """
+    remaining = max_bytes
+    while remaining is None or remaining > 0:
+        size = chunk_size if remaining is None else min(chunk_size, remaining)
+        chunk = file_obj.read(size)
+        if not chunk:
+            break
+        if remaining is not None:
+            remaining -= len(chunk)
+            if remaining <= 0 and not chunk.endswith(b"\n"):
+                chunk += file_obj.readline()
+        yield chunk
+
+
+def _multipart_stream(
+    files: Dict[str, tuple], boundary: str, max_bytes: Optional[int] = None
+):
+    """
+    Gera o corpo multipart/form-data em blocos.
+
+    Enviado como gerador, o corpo segue com Transfer-Encoding: chunked e os
+    arquivos nunca são carregados inteiros em memória.
+
+    Args:
+        files: Campos no formato {nome: (arquivo, handle, content_type)}
+        boundary: Delimitador das partes do multipart
+        max_bytes: Enviar no máximo este número de bytes de cada arquivo
+    """
+    for field_name, (filename, file_obj, content_type) in files.items():
+        yield (
+            f"--{boundary}\r\n"
+            f'Content-Disposition: form-data; name="{field_name}"; '
+            f'filename="{filename}"\r\n'
+            f"Content-Type: {content_type}\r\n\r\n"
+        ).encode()
+        yield from _read_chunks(file_obj, max_bytes=max_bytes)
+        yield b"\r\n"
+    yield f"--{boundary}--\r\n".encode()
+
+
+async def _aiter_file(path: Path, chunk_size: int = UPLOAD_CHUNK_SIZE):
+    """Lê um arquivo em blocos sem bloquear o event loop (aiofiles)."""
+    import aiofiles
+
+    async with aiofiles.open(path, "rb") as file_obj:
+        while True:
+            chunk = await file_obj.read(chunk_size)
+            if not chunk:
+                break
+            yield chunk
+
+
+def _gzip_stream(chunks, compresslevel: int = 1):
+    """
+    Compacta um fluxo de blocos em formato gzip, bloco a bloco.
+
+    O nível 1 é o mais rápido: logs são muito repetitivos e já compactam
+    bem sem custo relevante de CPU.
+    """
+    compressor = zlib.compressobj(compresslevel, zlib.DEFLATED, zlib.MAX_WBITS | 16)
+    for chunk in chunks:
+        data = compressor.compress(chunk)
+        if data:
+            yield data
+    yield compressor.flush()
+
 
 class LogAnalyzerAPIClient:
     """Cliente para interagir com a API Log Analyzer."""
 
-    def __init__(self, base_url: str = "http://127.0.0.1:8000"):
+    def __init__(
+        self,
+        base_url: str = "http://127.0.0.1:8000",
+        cache_ttl: float = 5,
+        warmup: bool = True,
+    ):
         """
         Inicializar cliente da API.
 
         Args:
             base_url: URL base da API
+            cache_ttl: Tempo (segundos) em que respostas de status, saúde e
+                informações da API são reutilizadas. Use 0 para desativar
+            warmup: Abrir uma conexão com a API já na criação do cliente
         """
+        import requests
+        from requests.adapters import HTTPAdapter
+        from urllib3.util.retry import Retry
+
+        self._requests = requests
         self.base_url = base_url.rstrip("/")
         self.session = requests.Session()
+        self.cache_ttl = cache_ttl
+        self._cache: Dict[str, Tuple[float, Dict[str, Any]]] = {}
+
+        # Pool de conexões reutilizável e retentativas para falhas transitórias.
+        # Apenas métodos idempotentes são repetidos: o corpo dos uploads é um
+        # gerador e não pode ser reenviado.
+        adapter = HTTPAdapter(
+            pool_connections=8,
+            pool_maxsize=32,
+            max_retries=Retry(
+                total=3,
+                backoff_factor=0.2,
+                status_forcelist=(502, 503, 504),
+                allowed_methods=frozenset(["GET", "HEAD"]),
+            ),
+        )
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+        self._adapter = adapter
+
+        if warmup:
+            self.warmup()
+
+    def warmup(self) -> None:
+        """
+        Aquecer o pool de conexões com um GET leve em /health.
+
+        A conexão aberta aqui é reutilizada pela primeira requisição real,
+        que deixa de pagar o handshake TCP/TLS. Falhas são ignoradas, e a
+        consulta é feita sem retentativas: com a API fora do ar, o aquecimento
+        não atrasa a primeira chamada real.
+        """
+        from urllib3.util.retry import Retry
+
+        retries = self._adapter.max_retries
+        self._adapter.max_retries = Retry(0, read=False)
+        try:
+            self.session.get(f"{self.base_url}/health", timeout=1.0)
+        except self._requests.RequestException:
+            pass
+        finally:
+            self._adapter.max_retries = retries
+
+    def invalidate(self) -> None:
+        """Descartar respostas armazenadas em cache."""
+        self._cache.clear()
+
+    def _cached_get(self, path: str, error_message: str) -> Dict[str, Any]:
+        """
+        Executar um GET, reutilizando a resposta enquanto o TTL não expirar.
+
+        Args:
+            path: Caminho do endpoint
+            error_message: Prefixo da mensagem em caso de erro
+
+        Returns:
+            Dict: Resposta da API ou dicionário de erro (nunca armazenado)
+        """
+        cached = self._cache.get(path)
+        if cached and time.monotonic() - cached[0] < self.cache_ttl:
+            return cached[1]
+
+        try:
+            response = self.session.get(f"{self.base_url}{path}")
+            response.raise_for_status()
+            data = _json_loads(response.content)
+        except (self._requests.RequestException, ValueError) as e:
+            return {"error": f"{error_message}: {e}"}
+
+        self._cache[path] = (time.monotonic(), data)
+        return data
 
     def get_status(self) -> Dict[str, Any]:
         """
@@ -44,12 +235,7 @@ class LogAnalyzerAPIClient:
         Returns:
             Dict: Status da API
         """
-        try:
-            response = self.session.get(f"{self.base_url}/")
-            response.raise_for_status()
-            return response.json()
-        except requests.exceptions.RequestException as e:
-            return {"error": f"Erro ao conectar com a API: {e}"}
+        return self._cached_get("/", "Erro ao conectar com a API")
 
     def get_health(self) -> Dict[str, Any]:
         """
@@ -58,12 +244,7 @@ class LogAnalyzerAPIClient:
         Returns:
             Dict: Informações de saúde
         """
-        try:
-            response = self.session.get(f"{self.base_url}/health")
-            response.raise_for_status()
-            return response.json()
-        except requests.exceptions.RequestException as e:
-            return {"error": f"Erro ao verificar saúde da API: {e}"}
+        return self._cached_get("/health", "Erro ao verificar saúde da API")
 
     def get_api_info(self) -> Dict[str, Any]:
         """
@@ -72,17 +253,15 @@ class LogAnalyzerAPIClient:
         Returns:
             Dict: Informações da API
         """
-        try:
-            response = self.session.get(f"{self.base_url}/api-info")
-            response.raise_for_status()
-            return response.json()
-        except requests.exceptions.RequestException as e:
-            return {"error": f"Erro ao obter informações da API: {e}"}
+        return self._cached_get("/api-info", "Erro ao obter informações da API")
 
     def analyze_logs(
         self,
         firewall_log_path: Optional[str] = None,
         auth_log_path: Optional[str] = None,
+        separate: bool = False,
+        compress: bool = False,
+        max_bytes: Optional[int] = None,
     ) -> Dict[str, Any]:
         """
         Analisar logs enviando arquivos para a API.
@@ -90,6 +269,13 @@ class LogAnalyzerAPIClient:
         Args:
             firewall_log_path: Caminho para o log de firewall
             auth_log_path: Caminho para o log de autenticação
+            separate: Enviar cada arquivo em uma requisição própria, em
+                paralelo. Os resultados são devolvidos por campo
+                (``firewall_log``/``auth_log``) e analisados de forma independente
+            compress: Compactar o corpo do upload com gzip
+                (Content-Encoding: gzip)
+            max_bytes: Enviar apenas o início de cada arquivo (até este número
+                de bytes) para uma triagem rápida. O resultado é parcial
 
         Returns:
             Dict: Resultados da análise
@@ -97,48 +283,303 @@ class LogAnalyzerAPIClient:
         if not firewall_log_path and not auth_log_path:
             return {"error": "Pelo menos um arquivo de log deve ser fornecido"}
 
-        files = {}
+        uploads = []
+
+        if firewall_log_path:
+            firewall_path = Path(firewall_log_path)
+            if not firewall_path.exists():
+                return {
+                    "error": f"Arquivo de firewall não encontrado: {firewall_log_path}"
+                }
+            uploads.append(("firewall_log", firewall_path))
+
+        if auth_log_path:
+            auth_path = Path(auth_log_path)
+            if not auth_path.exists():
+                return {"error": f"Arquivo de auth não encontrado: {auth_log_path}"}
+            uploads.append(("auth_log", auth_path))
+
+        if separate and len(uploads) > 1:
+            with ThreadPoolExecutor(max_workers=len(uploads)) as executor:
+                results = executor.map(
+                    lambda upload: self._post_files([upload], compress, max_bytes),
+                    uploads,
+                )
+                return {
+                    field_name: result
+                    for (field_name, _), result in zip(uploads, results)
+                }
+
+        return self._post_files(uploads, compress, max_bytes)
 
+    def _post_files(
+        self,
+        uploads: List[Tuple[str, Path]],
+        compress: bool = False,
+        max_bytes: Optional[int] = None,
+    ) -> Dict[str, Any]:
+        """
+        Enviar arquivos para /analyze/ em uma única requisição.
+
+        Args:
+            uploads: Lista de (campo do formulário, caminho do arquivo)
+            compress: Compactar o corpo com gzip
+            max_bytes: Limite de bytes enviados por arquivo
+
+        Returns:
+            Dict: Resposta da API ou dicionário de erro
+        """
         try:
-            if firewall_log_path:
-                firewall_path = Path(firewall_log_path)
-                if not firewall_path.exists():
-                    return {
-                        "error": f"Arquivo de firewall não encontrado: {firewall_log_path}"
-                    }
-                files["firewall_log"] = (
-                    firewall_path.name,
-                    open(firewall_path, "rb"),
-                    "application/octet-stream",
+            # Cada arquivo é registrado no ExitStack ao ser aberto e fechado
+            # ao sair do bloco, mesmo se uma abertura posterior falhar
+            with contextlib.ExitStack() as stack:
+                files = {
+                    field_name: (
+                        path.name,
+                        stack.enter_context(open(path, "rb")),
+                        "application/octet-stream",
+                    )
+                    for field_name, path in uploads
+                }
+
+                boundary = uuid.uuid4().hex
+                body = _multipart_stream(files, boundary, max_bytes)
+                headers = {"Content-Type": f"multipart/form-data; boundary={boundary}"}
+                if max_bytes is not None:
+                    headers["X-Log-Truncated-Bytes"] = str(max_bytes)
+                if compress:
+                    body = _gzip_stream(body)
+                    headers["Content-Encoding"] = "gzip"
+
+                response = self.session.post(
+                    f"{self.base_url}/analyze/", data=body, headers=headers
                 )
+            response.raise_for_status()
 
-            if auth_log_path:
-                auth_path = Path(auth_log_path)
-                if not auth_path.exists():
-                    return {"error": f"Arquivo de auth não encontrado: {auth_log_path}"}
-                files["auth_log"] = (
-                    auth_path.name,
-                    open(auth_path, "rb"),
-                    "application/octet-stream",
-                )
+            return _json_loads(response.content)
 
-            response = self.session.post(f"{self.base_url}/analyze/", files=files)
-            response.raise_for_status()
+        except (self._requests.RequestException, ValueError) as e:
+            return {"error": f"Erro ao analisar logs: {e}"}
+
+
+class AsyncLogAnalyzerAPIClient:
+    """
+    Cliente assíncrono (aiohttp) para a API Log Analyzer.
+
+    Deve ser usado como gerenciador de contexto assíncrono para que a sessão
+    e o pool de conexões sejam compartilhados entre as requisições.
+    """
+
+    def __init__(self, base_url: str = "http://127.0.0.1:8000"):
+        """
+        Inicializar cliente assíncrono da API.
+
+        Args:
+            base_url: URL base da API
+        """
+        if not AIOHTTP_AVAILABLE:
+            raise RuntimeError(
+                "aiohttp não está instalado. Execute: pip install aiohttp"
+            )
+
+        import aiohttp
+
+        self._aiohttp = aiohttp
+        self.base_url = base_url.rstrip("/")
+        self.session: Optional["aiohttp.ClientSession"] = None
+
+    async def __aenter__(self) -> "AsyncLogAnalyzerAPIClient":
+        self.session = self._aiohttp.ClientSession(
+            connector=self._aiohttp.TCPConnector(limit=32, keepalive_timeout=75)
+        )
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.session.close()
+
+    async def _get_json(self, path: str, error_message: str) -> Dict[str, Any]:
+        """Executa um GET e devolve o JSON ou um dicionário de erro."""
+        try:
+            async with self.session.get(f"{self.base_url}{path}") as response:
+                response.raise_for_status()
+                return _json_loads(await response.read())
+        except (self._aiohttp.ClientError, ValueError) as e:
+            return {"error": f"{error_message}: {e}"}
+
+    async def get_status(self) -> Dict[str, Any]:
+        """Obter status da API."""
+        return await self._get_json("/", "Erro ao conectar com a API")
+
+    async def get_health(self) -> Dict[str, Any]:
+        """Verificar saúde da API."""
+        return await self._get_json("/health", "Erro ao verificar saúde da API")
+
+    async def get_api_info(self) -> Dict[str, Any]:
+        """Obter informações sobre a API."""
+        return await self._get_json("/api-info", "Erro ao obter informações da API")
+
+    async def analyze_logs(
+        self,
+        firewall_log_path: Optional[str] = None,
+        auth_log_path: Optional[str] = None,
+    ) -> Dict[str, Any]:
+        """
+        Analisar logs enviando arquivos para a API.
 
-            return response.json()
+        Args:
+            firewall_log_path: Caminho para o log de firewall
+            auth_log_path: Caminho para o log de autenticação
 
-        except requests.exceptions.RequestException as e:
+        Returns:
+            Dict: Resultados da análise
+        """
+        if not firewall_log_path and not auth_log_path:
+            return {"error": "Pelo menos um arquivo de log deve ser fornecido"}
+
+        uploads = []
+        if firewall_log_path:
+            firewall_path = Path(firewall_log_path)
+            if not firewall_path.exists():
+                return {
+                    "error": f"Arquivo de firewall não encontrado: {firewall_log_path}"
+                }
+            uploads.append(("firewall_log", firewall_path))
+
+        if auth_log_path:
+            auth_path = Path(auth_log_path)
+            if not auth_path.exists():
+                return {"error": f"Arquivo de auth não encontrado: {auth_log_path}"}
+            uploads.append(("auth_log", auth_path))
+
+        try:
+            with contextlib.ExitStack() as stack:
+                data = self._aiohttp.FormData()
+                for field_name, path in uploads:
+                    # Com aiofiles, o disco é lido em outra thread enquanto o
+                    # event loop atende as demais requisições
+                    if AIOFILES_AVAILABLE:
+                        content = _aiter_file(path)
+                    else:
+                        content = stack.enter_context(open(path, "rb"))
+                    data.add_field(
+                        field_name,
+                        content,
+                        filename=path.name,
+                        content_type="application/octet-stream",
+                    )
+
+                async with self.session.post(
+                    f"{self.base_url}/analyze/", data=data
+                ) as response:
+                    response.raise_for_status()
+                    return _json_loads(await response.read())
+
+        except (self._aiohttp.ClientError, ValueError) as e:
             return {"error": f"Erro ao analisar logs: {e}"}
-        finally:
-            # Fechar arquivos abertos
-            for file_info in files.values():
-                if hasattr(file_info[1], "close"):
-                    file_info[1].close()
+
+
+async def fetch_status_and_health(base_url: str):
+    """Consultar status e saúde da API em paralelo."""
+    import asyncio
+
+    async with AsyncLogAnalyzerAPIClient(base_url) as client:
+        return await asyncio.gather(client.get_status(), client.get_health())
+
+
+async def analyze_batch(
+    base_url: str,
+    pairs: List[Tuple[Optional[str], Optional[str]]],
+    concurrency: int = 6,
+):
+    """
+    Analisar vários pares de logs sobre uma única sessão aiohttp.
+
+    No máximo ``concurrency`` uploads ficam em andamento ao mesmo tempo.
+    Os resultados são produzidos à medida que ficam prontos, não na ordem
+    de entrada.
+
+    Args:
+        base_url: URL base da API
+        pairs: Lista de (log de firewall, log de autenticação)
+        concurrency: Número máximo de requisições simultâneas
+
+    Yields:
+        Tupla (par analisado, resultado da análise)
+
+    Raises:
+        ValueError: Se concurrency for menor que 1
+    """
+    import asyncio
+
+    if concurrency < 1:
+        raise ValueError("concurrency deve ser pelo menos 1")
+
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async with AsyncLogAnalyzerAPIClient(base_url) as client:
+
+        async def analyze_pair(pair):
+            async with semaphore:
+                return pair, await client.analyze_logs(*pair)
+
+        for task in asyncio.as_completed([analyze_pair(pair) for pair in pairs]):
+            yield await task
+
+
+def is_firewall_log(file_path: str) -> bool:
+    """Indica se o nome do arquivo identifica um log de firewall."""
+    tokens = _FILENAME_TOKEN_RE.split(Path(file_path).stem.lower())
+    return not FIREWALL_TOKENS.isdisjoint(tokens)
+
+
+def split_log_paths(paths: List[str]) -> Tuple[Optional[str], Optional[str]]:
+    """
+    Separar os caminhos informados em (log de firewall, log de autenticação).
+
+    Com um único arquivo, o tipo é detectado pelo nome.
+
+    Raises:
+        ValueError: Se mais de 2 arquivos forem informados
+    """
+    if len(paths) == 1:
+        if is_firewall_log(paths[0]):
+            return paths[0], None
+        return None, paths[0]
+    if len(paths) == 2:
+        return paths[0], paths[1]
+    raise ValueError("Máximo de 2 arquivos são suportados")
+
+
+def read_batch_manifest(
+    manifest_path: str,
+) -> List[Tuple[Optional[str], Optional[str]]]:
+    """
+    Ler um manifesto de lote: uma análise por linha, com 1 ou 2 arquivos
+    separados por espaço. Linhas vazias e iniciadas por ``#`` são ignoradas.
+    """
+    pairs = []
+    with open(manifest_path, encoding="utf-8") as manifest:
+        for line in manifest:
+            paths = line.split()
+            if paths and not paths[0].startswith("#"):
+                pairs.append(split_log_paths(paths))
+    return pairs
+
+
+def print_json_line(data: Dict[str, Any]) -> None:
+    """Imprimir JSON compacto em uma única linha (JSON Lines)."""
+    if ORJSON_AVAILABLE:
+        print(orjson.dumps(data).decode(), flush=True)
+    else:
+        print(json.dumps(data, ensure_ascii=False), flush=True)
 
 
 def print_json_pretty(data: Dict[str, Any]) -> None:
     """Imprimir JSON de forma formatada."""
-    print(json.dumps(data, indent=2, ensure_ascii=False))
+    if ORJSON_AVAILABLE:
+        print(orjson.dumps(data, option=orjson.OPT_INDENT_2).decode())
+    else:
+        print(json.dumps(data, indent=2, ensure_ascii=False))
 
 
 def create_sample_data() -> None:
@@ -149,7 +590,7 @@ def create_sample_data() -> None:
     # Criar log de firewall de exemplo
     firewall_sample = data_dir / "sample_firewall.csv"
     if not firewall_sample.exists():
-        firewall_content = """timestamp,source_ip,destination_ip,port,protocol,action
+        firewall_content = b"""timestamp,source_ip,destination_ip,port,protocol,action
 2024-01-01 10:00:01,192.168.1.100,10.0.0.1,80,TCP,ALLOW
 2024-01-01 10:00:02,203.0.113.5,10.0.0.1,22,TCP,DENY
 2024-01-01 10:00:03,203.0.113.5,10.0.0.1,22,TCP,DENY
@@ -159,13 +600,13 @@ def create_sample_data() -> None:
 2024-01-01 10:00:07,203.0.113.5,10.0.0.1,23,TCP,DENY
 2024-01-01 10:00:08,203.0.113.5,10.0.0.1,25,TCP,DENY"""
 
-        firewall_sample.write_text(firewall_content)
+        firewall_sample.write_bytes(firewall_content)
         print(f"✅ Arquivo de exemplo criado: {firewall_sample}")
 
     # Criar log de autenticação de exemplo
     auth_sample = data_dir / "sample_auth.csv"
     if not auth_sample.exists():
-        auth_content = """timestamp,username,source_ip,event_type,success
+        auth_content = b"""timestamp,username,source_ip,event_type,success
 2024-01-01 10:01:01,admin,192.168.1.50,login,true
 2024-01-01 10:01:05,admin,203.0.113.5,login,false
 2024-01-01 10:01:10,admin,203.0.113.5,login,false
@@ -174,12 +615,17 @@ def create_sample_data() -> None:
 2024-01-01 10:01:25,admin,203.0.113.5,login,false
 2024-01-01 10:01:30,admin,203.0.113.5,login,false"""
 
-        auth_sample.write_text(auth_content)
+        auth_sample.write_bytes(auth_content)
         print(f"✅ Arquivo de exemplo criado: {auth_sample}")
 
 
 def main():
     """Função principal do cliente de exemplo."""
+    # Caminho rápido: criar amostras dispensa o parser e o cliente HTTP
+    if sys.argv[1:] == ["--create-samples"]:
+        create_sample_data()
+        return
+
     parser = argparse.ArgumentParser(
         description="Cliente de exemplo para a API Log Analyzer",
         formatter_class=argparse.RawDescriptionHelpFormatter,
@@ -208,26 +654,73 @@ def main():
         help="Analisar logs (forneça 1 ou 2 arquivos: firewall e/ou auth)",
     )
 
+    parser.add_argument(
+        "--batch",
+        metavar="MANIFEST",
+        help="Analisar em lote os arquivos listados no manifesto (1 ou 2 "
+        "arquivos por linha); resultados em JSON Lines",
+    )
+
+    parser.add_argument(
+        "--concurrency",
+        type=int,
+        default=6,
+        help="Com --batch, número máximo de análises simultâneas (default: 6)",
+    )
+
+    parser.add_argument(
+        "--separate",
+        action="store_true",
+        help="Com --analyze, enviar firewall e auth em requisições paralelas",
+    )
+
+    parser.add_argument(
+        "--gzip",
+        action="store_true",
+        help="Com --analyze, compactar os arquivos enviados com gzip",
+    )
+
+    parser.add_argument(
+        "--head-mb",
+        type=float,
+        default=None,
+        help="Com --analyze, enviar apenas os primeiros N MB de cada arquivo "
+        "(triagem rápida, resultado parcial)",
+    )
+
     parser.add_argument(
         "--info", action="store_true", help="Obter informações sobre a API"
     )
 
     args = parser.parse_args()
 
-    # Criar cliente
-    client = LogAnalyzerAPIClient(args.url)
+    if args.concurrency < 1:
+        parser.error("--concurrency deve ser pelo menos 1")
 
     if args.create_samples:
         create_sample_data()
         return
 
+    # Criar cliente (uma única sessão para toda a execução). O aquecimento só
+    # vale a pena quando o cliente síncrono fará requisições.
+    client = LogAnalyzerAPIClient(
+        args.url,
+        warmup=bool(args.info or args.analyze)
+        or (bool(args.test_status or args.batch) and not AIOHTTP_AVAILABLE),
+    )
+
     if args.test_status:
+        if AIOHTTP_AVAILABLE:
+            import asyncio
+
+            status, health = asyncio.run(fetch_status_and_health(args.url))
+        else:
+            status, health = client.get_status(), client.get_health()
+
         print("🔍 Testando status da API...")
-        status = client.get_status()
         print_json_pretty(status)
 
         print("\n🏥 Verificando saúde da API...")
-        health = client.get_health()
         print_json_pretty(health)
         return
 
@@ -237,27 +730,53 @@ def main():
         print_json_pretty(info)
         return
 
+    if args.batch:
+        try:
+            pairs = read_batch_manifest(args.batch)
+        except (OSError, ValueError) as e:
+            print(f"❌ Manifesto inválido: {e}", file=sys.stderr)
+            return 1
+
+        if AIOHTTP_AVAILABLE:
+            import asyncio
+
+            async def stream_results():
+                async for (firewall_path, auth_path), result in analyze_batch(
+                    args.url, pairs, args.concurrency
+                ):
+                    print_json_line(
+                        {
+                            "firewall_log": firewall_path,
+                            "auth_log": auth_path,
+                            "result": result,
+                        }
+                    )
+
+            asyncio.run(stream_results())
+        else:
+            for firewall_path, auth_path in pairs:
+                print_json_line(
+                    {
+                        "firewall_log": firewall_path,
+                        "auth_log": auth_path,
+                        "result": client.analyze_logs(firewall_path, auth_path),
+                    }
+                )
+        return
+
     if args.analyze:
         print(f"📊 Analisando logs: {args.analyze}")
 
-        firewall_path = None
-        auth_path = None
-
-        if len(args.analyze) == 1:
-            # Detectar tipo de arquivo pelo nome
-            file_path = args.analyze[0]
-            if "firewall" in file_path.lower() or "fw" in file_path.lower():
-                firewall_path = file_path
-            else:
-                auth_path = file_path
-        elif len(args.analyze) == 2:
-            firewall_path = args.analyze[0]
-            auth_path = args.analyze[1]
-        else:
-            print("❌ Máximo de 2 arquivos são suportados")
+        try:
+            firewall_path, auth_path = split_log_paths(args.analyze)
+        except ValueError as e:
+            print(f"❌ {e}")
             return
 
-        results = client.analyze_logs(firewall_path, auth_path)
+        max_bytes = int(args.head_mb * 1024 * 1024) if args.head_mb else None
+        results = client.analyze_logs(
+            firewall_path, auth_path, args.separate, args.gzip, max_bytes
+        )
         print_json_pretty(results)
         return
 
@@ -266,4 +785,4 @@ def main():
 
 
 if __name__ == "__main__":
-    main()
+    raise SystemExit(main())
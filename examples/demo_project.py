@@ -4,18 +4,41 @@ Demonstração Completa do Log Analyzer
 Mostra todas as funcionalidades do projeto em ação
 """
 
+import io
 import sys
 import os
+import threading
 import pandas as pd
 import requests
 import time
-import tempfile
 import json
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
 
 # Adicionar src ao path
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), "src"))
 
 
+# Sessão HTTP compartilhada por todas as demonstrações (keep-alive)
+_SESSION = requests.Session()
+_SESSION.mount("http://", requests.adapters.HTTPAdapter(pool_maxsize=8))
+_SESSION.headers["Connection"] = "keep-alive"
+
+# Arquivo CSV de exemplo usado na demonstração de upload
+SAMPLE_CSV_BYTES = b"""timestamp,source_ip,destination_ip,action,status_code,bytes_transferred
+2024-01-01 10:00:00,192.168.1.100,8.8.8.8,allow,200,1024
+2024-01-01 10:00:30,192.168.1.100,8.8.8.8,block,403,0
+2024-01-01 10:01:00,192.168.1.100,8.8.8.8,allow,200,2048
+2024-01-01 10:01:30,10.0.0.50,1.1.1.1,allow,200,512
+2024-01-01 10:02:00,172.16.1.200,208.67.222.222,allow,200,1536
+2024-01-01 10:02:30,192.168.1.100,8.8.8.8,block,403,0
+2024-01-01 10:03:00,192.168.1.100,8.8.8.8,allow,200,1024"""
+SAMPLE_ROWS = SAMPLE_CSV_BYTES.count(b"\n") + 1
+
+# Bytes lidos do final do relatório de performance
+REPORT_TAIL_BYTES = 8192
+
+
 def print_header(title):
     """Imprime cabeçalho formatado."""
     print("\n" + "=" * 60)
@@ -64,6 +87,17 @@ def demo_core_functionality():
                 "status_code": [200, 403, 200, 200, 200],
                 "bytes_transferred": [1024, 0, 2048, 512, 1536],
             }
+        ).astype(
+            {
+                "source_ip": "category",
+                "destination_ip": "category",
+                "action": "category",
+                "status_code": "int16",
+                "bytes_transferred": "int32",
+            }
+        )
+        sample_data["timestamp"] = pd.to_datetime(
+            sample_data["timestamp"], format="%Y-%m-%d %H:%M:%S", cache=True
         )
 
         print("✅ Dados de exemplo criados:")
@@ -84,10 +118,10 @@ def demo_core_functionality():
         )
 
         if len(brute_force_results) > 0:
-            for idx, result in brute_force_results.iterrows():
-                print(
-                    f"   ⚠️  IP: {result['source_ip']} - {result['failed_attempts']} tentativas"
-                )
+            for ip, attempts in brute_force_results[["ip", "attempts"]].itertuples(
+                index=False, name=None
+            ):
+                print(f"   ⚠️  IP: {ip} - {attempts} tentativas")
         else:
             print("   ✅ Nenhuma atividade suspeita de força bruta detectada")
 
@@ -156,19 +190,29 @@ def demo_geographic_analysis():
         return False
 
 
-def _api_get_request(url, description, success_callback=None):
-    """Helper for GET requests to API endpoints."""
+def _fetch(session, url):
+    """Executa um GET e devolve a resposta ou a exceção ocorrida."""
     try:
-        response = requests.get(url, timeout=5)
-        if response.status_code == 200:
-            if success_callback:
-                success_callback(response)
-            return True
-        else:
-            print(f"⚠️  {description} respondeu com status {response.status_code}")
-            return False
+        return session.get(url, timeout=5)
     except requests.exceptions.RequestException as e:
-        print(f"❌ {description} não está acessível: {e}")
+        return e
+
+
+def _api_get_request(url, description, success_callback=None, response=None):
+    """Helper for GET requests to API endpoints."""
+    if response is None:
+        response = _fetch(_SESSION, url)
+
+    if isinstance(response, requests.exceptions.RequestException):
+        print(f"❌ {description} não está acessível: {response}")
+        return False
+
+    if response.status_code == 200:
+        if success_callback:
+            success_callback(response)
+        return True
+    else:
+        print(f"⚠️  {description} respondeu com status {response.status_code}")
         return False
 
 
@@ -205,6 +249,16 @@ def demo_api_functionality():
     print_section("REST API - Endpoints e Funcionalidades")
     base_url = "http://127.0.0.1:8000"
 
+    # Os endpoints são independentes: consultar todos em paralelo,
+    # reutilizando as conexões da sessão compartilhada
+    paths = ["/", "/health", "/api-info", "/metrics"]
+    with ThreadPoolExecutor(max_workers=len(paths)) as executor:
+        futures = {
+            path: executor.submit(_fetch, _SESSION, f"{base_url}{path}")
+            for path in paths
+        }
+        responses = {path: future.result() for path, future in futures.items()}
+
     # Verificar se API está rodando
     def print_root(response):
         print("✅ API está rodando e respondendo")
@@ -212,15 +266,19 @@ def demo_api_functionality():
         print(f"   📊 Status: {data.get('status', 'N/A')}")
         print(f"   🕐 Timestamp: {data.get('timestamp', 'N/A')}")
 
-    if not _api_get_request(f"{base_url}/", "API raiz", print_root):
+    if not _api_get_request(f"{base_url}/", "API raiz", print_root, responses["/"]):
         print("   💡 Certifique-se de que a API está rodando em http://127.0.0.1:8000")
         return False
 
     print("\n🏥 Testando health check...")
-    _api_get_request(f"{base_url}/health", "Health check", _print_health)
+    _api_get_request(
+        f"{base_url}/health", "Health check", _print_health, responses["/health"]
+    )
 
     print("\n📋 Obtendo informações da API...")
-    _api_get_request(f"{base_url}/api-info", "API info", _print_api_info)
+    _api_get_request(
+        f"{base_url}/api-info", "API info", _print_api_info, responses["/api-info"]
+    )
 
     print("\n📈 Verificando métricas...")
 
@@ -230,7 +288,9 @@ def demo_api_functionality():
         else:
             print(f"   ⚠️  Métricas não disponíveis (status {response.status_code})")
 
-    _api_get_request(f"{base_url}/metrics", "Métricas", metrics_callback)
+    _api_get_request(
+        f"{base_url}/metrics", "Métricas", metrics_callback, responses["/metrics"]
+    )
 
     return True
 
@@ -239,73 +299,48 @@ def demo_file_processing():
     """Demonstra processamento de arquivos."""
     print_section("FILE PROCESSING - Upload e Análise")
 
-    # Criar arquivo CSV de exemplo
-    sample_csv = """timestamp,source_ip,destination_ip,action,status_code,bytes_transferred
-2024-01-01 10:00:00,192.168.1.100,8.8.8.8,allow,200,1024
-2024-01-01 10:00:30,192.168.1.100,8.8.8.8,block,403,0
-2024-01-01 10:01:00,192.168.1.100,8.8.8.8,allow,200,2048
-2024-01-01 10:01:30,10.0.0.50,1.1.1.1,allow,200,512
-2024-01-01 10:02:00,172.16.1.200,208.67.222.222,allow,200,1536
-2024-01-01 10:02:30,192.168.1.100,8.8.8.8,block,403,0
-2024-01-01 10:03:00,192.168.1.100,8.8.8.8,allow,200,1024"""
-
     try:
-        # Salvar arquivo temporário
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".csv", delete=False) as f:
-            f.write(sample_csv)
-            temp_file = f.name
-
-        print(f"✅ Arquivo de exemplo criado: {temp_file}")
-        print(f"   📊 Tamanho: {len(sample_csv)} bytes")
-        print(f"   📋 Linhas: {sample_csv.count('newline') + 1}")
+        print("✅ Arquivo de exemplo preparado em memória: sample.csv")
+        print(f"   📊 Tamanho: {len(SAMPLE_CSV_BYTES)} bytes")
+        print(f"   📋 Linhas: {SAMPLE_ROWS}")
 
         # Tentar upload via API
         base_url = "http://127.0.0.1:8000"
         try:
             print("\n📤 Testando upload via API...")
-            with open(temp_file, "rb") as file:
-                files = {"firewall_log": file}
-                response = requests.post(
-                    f"{base_url}/analyze/", files=files, timeout=30
+            files = {
+                "firewall_log": ("sample.csv", io.BytesIO(SAMPLE_CSV_BYTES), "text/csv")
+            }
+            response = _SESSION.post(f"{base_url}/analyze/", files=files, timeout=30)
+
+            if response.status_code == 200:
+                result = response.json()
+                summary = result.get("summary", {})
+                print("   ✅ Upload bem-sucedido!")
+                print(
+                    f"   📊 Arquivos processados: {summary.get('files_processed', 0)}"
+                )
+                print(f"   📈 Total de eventos: {summary.get('total_events', 0)}")
+                print(
+                    f"   ⏱️  Tempo de processamento: {summary.get('processing_time_seconds', 0):.2f}s"
                 )
 
-                if response.status_code == 200:
-                    result = response.json()
-                    summary = result.get("summary", {})
-                    print("   ✅ Upload bem-sucedido!")
-                    print(
-                        f"   📊 Arquivos processados: {summary.get('files_processed', 0)}"
-                    )
-                    print(f"   📈 Total de eventos: {summary.get('total_events', 0)}")
+                # Mostrar alguns resultados
+                brute_force = result.get("brute_force_attacks", [])
+                if brute_force:
                     print(
-                        f"   ⏱️  Tempo de processamento: {summary.get('processing_time_seconds', 0):.2f}s"
+                        f"   ⚠️  Ataques de força bruta detectados: {len(brute_force)}"
                     )
-
-                    # Mostrar alguns resultados
-                    brute_force = result.get("brute_force_attacks", [])
-                    if brute_force:
-                        print(
-                            f"   ⚠️  Ataques de força bruta detectados: {len(brute_force)}"
-                        )
-                    else:
-                        print("   ✅ Nenhum ataque de força bruta detectado")
-
                 else:
-                    print(f"   ❌ Upload falhou com status {response.status_code}")
-                    print(f"   📝 Resposta: {response.text}")
+                    print("   ✅ Nenhum ataque de força bruta detectado")
+
+            else:
+                print(f"   ❌ Upload falhou com status {response.status_code}")
+                print(f"   📝 Resposta: {response.text}")
 
         except requests.exceptions.RequestException as e:
             print(f"   ❌ Erro no upload: {e}")
 
-        finally:
-            # Limpar arquivo temporário
-            try:
-                os.unlink(temp_file)
-                print("   🧹 Arquivo temporário removido")
-            except OSError:
-                # Ignora erros de remoção de arquivo
-                pass
-
         return True
 
     except Exception as e:
@@ -363,17 +398,21 @@ def demo_performance_summary():
     print_section("PERFORMANCE SUMMARY - Métricas Atuais")
 
     try:
-        # Ler relatório de performance se existir
-        import glob
-
-        performance_files = glob.glob("performance_report_*.txt")
+        # Ler relatório de performance mais recente, se existir
+        latest_report = max(
+            Path(".").glob("performance_report_*.txt"),
+            key=lambda report: report.stat().st_mtime,
+            default=None,
+        )
 
-        if performance_files:
-            latest_report = max(performance_files)
+        if latest_report:
             print(f"✅ Último relatório de performance: {latest_report}")
 
-            with open(latest_report, "r", encoding="utf-8") as f:
-                lines = f.readlines()
+            # O resumo fica no final do relatório: ler apenas a cauda
+            with open(latest_report, "rb") as f:
+                f.seek(0, os.SEEK_END)
+                f.seek(max(0, f.tell() - REPORT_TAIL_BYTES))
+                lines = f.read().decode("utf-8", "ignore").splitlines()
 
             # Extrair métricas importantes
             for line in lines:
@@ -395,27 +434,97 @@ def demo_performance_summary():
         return False
 
 
+class _ThreadLocalOutput:
+    """Redireciona a saída de cada thread para seu próprio buffer, se houver."""
+
+    def __init__(self, stream):
+        self._stream = stream
+        self._local = threading.local()
+
+    def capture(self):
+        """Passa a acumular a saída da thread atual em um buffer."""
+        self._local.buffer = io.StringIO()
+
+    def release(self):
+        """Encerra a captura da thread atual e devolve o texto acumulado."""
+        buffer, self._local.buffer = self._local.buffer, None
+        return buffer.getvalue()
+
+    def write(self, text):
+        return (getattr(self._local, "buffer", None) or self._stream).write(text)
+
+    def __getattr__(self, name):
+        return getattr(self._stream, name)
+
+
+def _run_demo(demo_name, demo_func):
+    """Executa uma demonstração, convertendo exceções em falha."""
+    try:
+        return demo_func()
+    except Exception as e:
+        print(f"❌ Erro inesperado em {demo_name}: {e}")
+        return False
+
+
+def _run_demo_captured(output, demo_name, demo_func):
+    """Executa uma demonstração capturando sua saída."""
+    output.capture()
+    try:
+        success = _run_demo(demo_name, demo_func)
+    finally:
+        text = output.release()
+    return success, text
+
+
+DEMOS = [
+    ("Core Functionality", demo_core_functionality),
+    ("Geographic Analysis", demo_geographic_analysis),
+    ("API Functionality", demo_api_functionality),
+    ("File Processing", demo_file_processing),
+    ("Cache System", demo_cache_system),
+    ("Performance Summary", demo_performance_summary),
+]
+
+# Demonstrações limitadas por I/O (rede, disco) rodam em paralelo;
+# as demais rodam na thread principal
+_IO_DEMOS = {
+    "Geographic Analysis",
+    "API Functionality",
+    "File Processing",
+    "Performance Summary",
+}
+
+
 def run_demos():
     """Executa todas as demonstrações e retorna os resultados."""
-    demos = [
-        ("Core Functionality", demo_core_functionality),
-        ("Geographic Analysis", demo_geographic_analysis),
-        ("API Functionality", demo_api_functionality),
-        ("File Processing", demo_file_processing),
-        ("Cache System", demo_cache_system),
-        ("Performance Summary", demo_performance_summary),
-    ]
-
-    results = []
-    for demo_name, demo_func in demos:
-        try:
-            success = demo_func()
-            results.append((demo_name, success))
-        except Exception as e:
-            print(f"❌ Erro inesperado em {demo_name}: {e}")
-            results.append((demo_name, False))
+    output = _ThreadLocalOutput(sys.stdout)
+    sys.stdout = output
+
+    try:
+        with ThreadPoolExecutor(max_workers=len(_IO_DEMOS)) as executor:
+            futures = {
+                demo_name: executor.submit(
+                    _run_demo_captured, output, demo_name, demo_func
+                )
+                for demo_name, demo_func in DEMOS
+                if demo_name in _IO_DEMOS
+            }
+
+            outcomes = {
+                demo_name: _run_demo(demo_name, demo_func)
+                for demo_name, demo_func in DEMOS
+                if demo_name not in _IO_DEMOS
+            }
+
+            # Exibir a saída das demonstrações paralelas em ordem fixa
+            for demo_name, future in futures.items():
+                success, text = future.result()
+                output.write(text)
+                outcomes[demo_name] = success
+    finally:
+        sys.stdout = output._stream
 
-    return results
+    return [(demo_name, outcomes[demo_name]) for demo_name, _ in DEMOS]
 
 
 def print_summary(results):
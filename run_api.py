@@ -10,6 +10,7 @@ Aplicando boas práticas de programação com:
 """
 
 import argparse
+import importlib.util
 import logging
 import sys
 from pathlib import Path
@@ -24,27 +25,26 @@ logger = logging.getLogger(__name__)
 DEFAULT_HOST = "127.0.0.1"
 DEFAULT_PORT = 8000
 DEFAULT_WORKERS = 1
+API_MODULE_PATH = Path(__file__).parent / "src" / "log_analyzer" / "api.py"
 
 
 def check_dependencies() -> bool:
     """Verifica se as dependências necessárias estão disponíveis."""
-    try:
-        import uvicorn
-
-        logger.info("✅ Uvicorn disponível")
-        return True
-    except ImportError:
+    # Apenas localiza o pacote; o uvicorn é importado uma vez, ao iniciar
+    if importlib.util.find_spec("uvicorn") is None:
         logger.error(
             "❌ Uvicorn não encontrado. Execute: pip install uvicorn[standard]"
         )
         return False
 
+    logger.info("✅ Uvicorn disponível")
+    return True
+
 
 def validate_project_structure() -> bool:
     """Valida se a estrutura do projeto está correta."""
-    api_module = Path(__file__).parent / "src" / "log_analyzer" / "api.py"
-    if not api_module.exists():
-        logger.error(f"❌ Módulo API não encontrado: {api_module}")
+    if not API_MODULE_PATH.exists():
+        logger.error(f"❌ Módulo API não encontrado: {API_MODULE_PATH}")
         return False
 
     logger.info("✅ Estrutura do projeto validada")
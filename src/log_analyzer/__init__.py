@@ -14,10 +14,28 @@ __version__ = "2.0.0"
 __author__ = "Security Team"
 __description__ = "Ferramenta de análise de logs de segurança"
 
+import importlib
+
 from .config import DEFAULT_CONFIG
-from .core import LogAnalyzer
-from .main import main
-from .utils import setup_logging, validate_file_format
+
+# Módulos que importam pandas/requests são carregados no primeiro acesso,
+# para que `python -m log_analyzer --help` não pague esse custo
+_LAZY_ATTRIBUTES = {
+    "LogAnalyzer": ".core",
+    "main": ".main",
+    "setup_logging": ".utils",
+    "validate_file_format": ".utils",
+}
+
+
+def __getattr__(name):
+    if name not in _LAZY_ATTRIBUTES:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    value = getattr(importlib.import_module(_LAZY_ATTRIBUTES[name], __name__), name)
+    globals()[name] = value
+    return value
+
 
 __all__ = [
     "LogAnalyzer",
@@ -26,5 +44,3 @@ __all__ = [
     "DEFAULT_CONFIG",
     "main",
 ]
-
-__all__ = ["LogAnalyzer", "setup_logging", "validate_file_format", "DEFAULT_CONFIG"]
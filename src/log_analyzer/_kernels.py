@@ -0,0 +1,37 @@
+"""
+Kernels compilados com Numba para as detecções do Log Analyzer
+
+Importado sob demanda por core.py, apenas quando o Numba está instalado.
+"""
+
+import numpy as np
+from numba import njit, prange
+
+
+@njit(parallel=True, cache=True)
+def first_dense_windows(timestamps, group_starts, window_ns, min_count):
+    """
+    Localiza, por grupo, a primeira janela com ao menos min_count eventos
+
+    Varredura com dois ponteiros, em paralelo entre os grupos. Mesmo contrato
+    de core._first_dense_windows_numpy.
+    """
+    n_groups = len(group_starts) - 1
+    out_start = np.full(n_groups, -1, dtype=np.int64)
+    out_end = np.zeros(n_groups, dtype=np.int64)
+
+    for g in prange(n_groups):
+        lo = group_starts[g]
+        hi = group_starts[g + 1]
+        end = lo
+        for i in range(lo, hi):
+            if hi - i < min_count:
+                break
+            while end < hi and timestamps[end] <= timestamps[i] + window_ns:
+                end += 1
+            if end - i >= min_count:
+                out_start[g] = i
+                out_end[g] = end
+                break
+
+    return out_start, out_end
@@ -10,7 +10,7 @@ import json
 import logging
 import os
 import time
-import psutil
+import zlib
 from datetime import datetime, timezone
 from typing import Dict, List, Optional, Any
 from functools import wraps
@@ -40,7 +40,7 @@ SUPPORTED_FORMATS = [".csv", ".json"]
 
 # Importações condicionais para robustez
 try:
-    from fastapi import FastAPI, File, HTTPException, UploadFile, Request, Depends, status
+    from fastapi import FastAPI, File, Header, HTTPException, UploadFile, Request, Depends, status
     from fastapi.responses import JSONResponse
     from fastapi.middleware.cors import CORSMiddleware
     from fastapi.security import OAuth2PasswordBearer, OAuth2PasswordRequestForm
@@ -203,6 +203,76 @@ class MetricsMiddleware(BaseHTTPMiddleware if FASTAPI_AVAILABLE else object):
             raise
 
 
+class GzipRequestMiddleware:
+    """Middleware ASGI que descompacta corpos enviados com Content-Encoding: gzip."""
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        """Substitui o receive por uma versão que descompacta o corpo em blocos."""
+        if scope["type"] != "http" or (
+            dict(scope["headers"]).get(b"content-encoding", b"").lower() != b"gzip"
+        ):
+            await self.app(scope, receive, send)
+            return
+
+        # O corpo repassado à aplicação já não está compactado
+        scope = dict(scope)
+        scope["headers"] = [
+            (name, value)
+            for name, value in scope["headers"]
+            if name not in (b"content-encoding", b"content-length")
+        ]
+        decompressor = zlib.decompressobj(wbits=zlib.MAX_WBITS | 16)
+        total_size = 0
+        too_large = False
+        response_started = False
+
+        async def receive_decompressed():
+            nonlocal total_size, too_large
+            message = await receive()
+            if message["type"] == "http.request":
+                # Limita a saída a MAX_FILE_SIZE + 1 bytes: um corpo pequeno não
+                # pode se expandir sem limite em memória (gzip bomb)
+                body = decompressor.decompress(
+                    message.get("body", b""), MAX_FILE_SIZE - total_size + 1
+                )
+                # Entrada não consumida significa que o limite já foi atingido
+                if not message.get("more_body", False) and not (
+                    decompressor.unconsumed_tail
+                ):
+                    body += decompressor.flush()
+
+                total_size += len(body)
+                if total_size > MAX_FILE_SIZE:
+                    too_large = True
+                    raise HTTPException(status_code=413, detail="Arquivo muito grande")
+                message = {**message, "body": body}
+            return message
+
+        async def send_unless_too_large(message):
+            nonlocal response_started
+            # Middlewares internos podem converter o erro do receive em outra
+            # resposta (ex.: 400); ela é descartada e substituída pelo 413
+            if too_large and not response_started:
+                return
+            response_started = True
+            await send(message)
+
+        try:
+            await self.app(scope, receive_decompressed, send_unless_too_large)
+        except Exception:
+            if not too_large or response_started:
+                raise
+
+        if too_large and not response_started:
+            response = JSONResponse(
+                status_code=413, content={"detail": "Arquivo muito grande"}
+            )
+            await response(scope, receive, send)
+
+
 # Instância global de monitoramento
 performance_monitor = PerformanceMonitor()
 
@@ -484,6 +554,9 @@ if FASTAPI_AVAILABLE:
     # Middleware de métricas
     app.add_middleware(MetricsMiddleware, monitor=performance_monitor)
 
+    # Uploads compactados (Content-Encoding: gzip)
+    app.add_middleware(GzipRequestMiddleware)
+
     @app.get("/")
     async def status() -> Dict[str, str]:
         """Status da API."""
@@ -573,13 +646,15 @@ if FASTAPI_AVAILABLE:
     async def analyze_logs(
         firewall_log: Optional[UploadFile] = File(None),
         auth_log: Optional[UploadFile] = File(None),
-        current_user: dict = Depends(get_current_user)
+        current_user: dict = Depends(get_current_user),
+        x_log_truncated_bytes: Optional[int] = Header(None),
     ) -> JSONResponse:
         """
         Análise de logs de segurança.
 
         Aceita uploads de arquivos CSV ou JSON para análise.
-        Requer autenticação JWT.
+        Requer autenticação JWT. O cabeçalho X-Log-Truncated-Bytes indica
+        que o cliente enviou apenas o início de cada arquivo.
         """
         if not firewall_log and not auth_log:
             raise HTTPException(
@@ -589,6 +664,11 @@ if FASTAPI_AVAILABLE:
         try:
             service = AnalysisService()
             results = service.analyze_files(firewall_log, auth_log)
+            if x_log_truncated_bytes is not None:
+                logger.info(
+                    f"Análise parcial: arquivos truncados em {x_log_truncated_bytes} bytes"
+                )
+                results["summary"]["truncated_bytes"] = x_log_truncated_bytes
             return JSONResponse(content=results, status_code=200)
 
         except HTTPException:
@@ -8,7 +8,7 @@ import json
 import time
 from collections import OrderedDict
 from functools import wraps
-from typing import Any, Callable, Dict, Optional
+from typing import Any, Callable, Dict, List, Optional
 
 
 class MemoryCache:
@@ -19,9 +19,12 @@ class MemoryCache:
         self.ttl_seconds = ttl_seconds
         self._cache: OrderedDict = OrderedDict()
         self._timestamps: Dict[str, float] = {}
+        self._hit_count = 0
+        self._access_count = 0
 
     def get(self, key: str) -> Optional[Any]:
         """Obtém valor do cache."""
+        self._access_count += 1
         if key not in self._cache:
             return None
 
@@ -32,6 +35,7 @@ class MemoryCache:
 
         # Mover para o final (LRU)
         self._cache.move_to_end(key)
+        self._hit_count += 1
         return self._cache[key]
 
     def set(self, key: str, value: Any) -> None:
@@ -49,6 +53,39 @@ class MemoryCache:
             oldest_key = next(iter(self._cache))
             self.delete(oldest_key)
 
+    def mget(self, keys: List[str]) -> List[Optional[Any]]:
+        """Obtém vários valores do cache, na ordem das chaves."""
+        now = time.time()
+        values = []
+        hits = 0
+        for key in keys:
+            if key not in self._cache:
+                values.append(None)
+            elif now - self._timestamps.get(key, 0) > self.ttl_seconds:
+                self.delete(key)
+                values.append(None)
+            else:
+                self._cache.move_to_end(key)
+                values.append(self._cache[key])
+                hits += 1
+
+        self._access_count += len(keys)
+        self._hit_count += hits
+        return values
+
+    def mset(self, items: Dict[str, Any]) -> None:
+        """Define vários valores no cache, com uma única verificação de tamanho."""
+        now = time.time()
+        for key, value in items.items():
+            self._cache.pop(key, None)
+            self._cache[key] = value
+            self._timestamps[key] = now
+
+        # Remove os mais antigos de uma vez (mesmo resultado de set() por item)
+        while len(self._cache) > self.max_size:
+            oldest_key = next(iter(self._cache))
+            self.delete(oldest_key)
+
     def delete(self, key: str) -> None:
         """Remove item do cache."""
         self._cache.pop(key, None)
@@ -70,8 +107,7 @@ class MemoryCache:
             "size": len(self._cache),
             "max_size": self.max_size,
             "ttl_seconds": self.ttl_seconds,
-            "hit_ratio": getattr(self, "_hit_count", 0)
-            / max(getattr(self, "_access_count", 1), 1),
+            "hit_ratio": self._hit_count / max(self._access_count, 1),
         }
 
 
@@ -107,6 +143,32 @@ class RedisCache:
         except Exception:
             pass
 
+    def mget(self, keys: List[str]) -> List[Optional[Any]]:
+        """Obtém vários valores do Redis em uma única ida ao servidor."""
+        if not self.available or not keys:
+            return [None] * len(keys)
+
+        try:
+            return [
+                json.loads(value) if value is not None else None
+                for value in self.redis_client.mget(keys)
+            ]
+        except Exception:
+            return [None] * len(keys)
+
+    def mset(self, items: Dict[str, Any]) -> None:
+        """Define vários valores no Redis com um pipeline (uma ida ao servidor)."""
+        if not self.available or not items:
+            return
+
+        try:
+            pipeline = self.redis_client.pipeline()
+            for key, value in items.items():
+                pipeline.setex(key, self.ttl_seconds, json.dumps(value, default=str))
+            pipeline.execute()
+        except Exception:
+            pass
+
     def delete(self, key: str) -> None:
         """Remove item do Redis."""
         if not self.available:
@@ -161,6 +223,30 @@ class HybridCache:
         self.memory_cache.set(key, value)
         self.redis_cache.set(key, value)
 
+    def mget(self, keys: List[str]) -> List[Optional[Any]]:
+        """Obtém vários valores (L1 em lote, L2 apenas para as faltas)."""
+        values = self.memory_cache.mget(keys)
+
+        missing = [i for i, value in enumerate(values) if value is None]
+        if missing:
+            redis_values = self.redis_cache.mget([keys[i] for i in missing])
+            promoted = {}
+            for i, value in zip(missing, redis_values):
+                if value is not None:
+                    values[i] = promoted[keys[i]] = value
+            # Armazenar em memória para próximas consultas
+            self.memory_cache.mset(promoted)
+
+        misses = sum(value is None for value in values)
+        self._hit_count += len(keys) - misses
+        self._miss_count += misses
+        return values
+
+    def mset(self, items: Dict[str, Any]) -> None:
+        """Define vários valores em ambos os caches."""
+        self.memory_cache.mset(items)
+        self.redis_cache.mset(items)
+
     def delete(self, key: str) -> None:
         """Remove item de ambos os caches."""
         self.memory_cache.delete(key)
@@ -20,6 +20,12 @@ DEFAULT_CONFIG = {
         "timeout_seconds": 5,  # Timeout para requisições
         "api_url": "http://ip-api.com/json",  # API de geolocalização
         "rate_limit_delay": 1.5,  # Delay entre requisições (segundos)
+        "max_workers": 20,  # Consultas individuais simultâneas
+        "batch_api_url": "http://ip-api.com/batch",  # Consulta em lote
+        "batch_size": 100,  # Máximo de IPs por requisição em lote
+        "batch_rate_limit_delay": 4.0,  # Delay entre requisições em lote (segundos)
+        "cache_file": ".ip_cache.db",  # Cache SQLite entre execuções (None desativa)
+        "cache_ttl_hours": 24,  # Validade das localizações em cache
         "high_risk_countries": ["CN", "RU", "KP", "IR", "BY"],  # Países de alto risco
     },
     # Risk Classification
@@ -2,14 +2,16 @@
 Classe principal do Log Analyzer
 """
 
+import importlib.util
 import json
 import os
 import time
 from collections import Counter, defaultdict
-from datetime import datetime, timedelta
+from datetime import datetime
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Set
 
+import numpy as np
 import pandas as pd
 import requests
 from rich import box
@@ -19,6 +21,7 @@ from rich.table import Table
 from rich.text import Text
 
 from .config import DEFAULT_CONFIG, SUPPORTED_SCHEMAS
+from .geographic import GeographicAnalyzer
 from .utils import (
     calculate_risk_score,
     clean_ip_address,
@@ -31,24 +34,116 @@ from .utils import (
     validate_required_columns,
 )
 
+# Colunas de texto com poucos valores distintos, carregadas como "category"
+CATEGORICAL_COLUMNS = (
+    "source_ip",
+    "destination_ip",
+    "action",
+    "status",
+    "service",
+    "username",
+    "protocol",
+)
+
+# Colunas do registro de IPs suspeitos (e do CSV exportado)
+SUSPECT_COLUMNS = (
+    "ip",
+    "tipo_de_alerta",
+    "ocorrencias",
+    "primeira_deteccao",
+    "ultima_deteccao",
+    "servicos_afetados",
+    "usuarios_alvo",
+)
+
+# Tipos aplicados já na leitura de CSV, evitando colunas de objetos Python
+CSV_DTYPES = {col: "category" for col in CATEGORICAL_COLUMNS}
+
+# O Numba só é importado quando usado: a importação custa centenas de ms
+NUMBA_AVAILABLE = importlib.util.find_spec("numba") is not None
+
+# Abaixo deste número de tentativas a compilação JIT custa mais que a varredura
+NUMBA_MIN_ROWS = 50_000
+
+
+def _count_by_first_appearance(values: pd.Series):
+    """
+    Conta as ocorrências de cada valor, na ordem de primeira aparição
+
+    Colunas categóricas são contadas direto pelos códigos inteiros, sem
+    calcular o hash das strings.
+
+    Args:
+        values: Série com os valores a contar (nulos são ignorados)
+
+    Returns:
+        Tupla (valores distintos, contagens)
+    """
+    if isinstance(values.dtype, pd.CategoricalDtype):
+        codes = values.cat.codes.to_numpy()
+        codes = codes[codes >= 0]
+        order = pd.unique(codes)
+        counts = np.bincount(codes, minlength=len(values.cat.categories))
+        return values.cat.categories[order], counts[order]
+
+    codes, uniques = pd.factorize(values)
+    counts = np.bincount(codes[codes >= 0], minlength=len(uniques))
+    return uniques, counts
+
+
+def _first_dense_windows_numpy(
+    timestamps: np.ndarray, group_starts: np.ndarray, window_ns: int, min_count: int
+):
+    """
+    Localiza, por grupo, a primeira janela com ao menos min_count eventos
+
+    Args:
+        timestamps: Timestamps em ns, ordenados dentro de cada grupo
+        group_starts: Índice inicial de cada grupo (último elemento = total)
+        window_ns: Tamanho da janela em nanossegundos
+        min_count: Número mínimo de eventos na janela
+
+    Returns:
+        Tupla (inícios, fins) por grupo; início -1 quando não há janela
+    """
+    n_groups = len(group_starts) - 1
+    out_start = np.full(n_groups, -1, dtype=np.int64)
+    out_end = np.zeros(n_groups, dtype=np.int64)
+
+    for g in range(n_groups):
+        lo, hi = group_starts[g], group_starts[g + 1]
+        if hi - lo < min_count:
+            continue
+
+        group_ts = timestamps[lo:hi]
+        window_ends = np.searchsorted(group_ts, group_ts + window_ns, side="right")
+        matches = np.flatnonzero(window_ends - np.arange(hi - lo) >= min_count)
+        if matches.size:
+            out_start[g] = lo + matches[0]
+            out_end[g] = lo + window_ends[matches[0]]
+
+    return out_start, out_end
+
 
 class LogAnalyzer:
     """Classe principal para análise de logs de segurança"""
 
-    def __init__(self, config: Optional[Dict[str, Any]] = None):
+    def __init__(self, config: Optional[Dict[str, Any]] = None, quiet: bool = False):
         """
         Inicializa o analisador de logs
 
         Args:
             config: Configurações customizadas (opcional)
+            quiet: Não renderizar tabelas e painéis no terminal
         """
         self.config = config or DEFAULT_CONFIG
-        self.console = Console()
+        self.console = Console(quiet=quiet)
         self.logger = setup_logging(self.config.get("logging"))
 
         # Dados de análise
         self.data = None  # DataFrame principal
-        self.failed_logins = []
+        self.failed_by_ip = pd.Series(dtype="int64")  # Logins falhados por IP
+        self.suspect_registry: Optional[pd.DataFrame] = None
         self.ip_access_count = Counter()
         self.brute_force_attempts = []
         self.port_scan_attempts = []
@@ -79,7 +174,7 @@ class LogAnalyzer:
         """
         try:
             self.logger.info(f"Carregando arquivo: {file_path}")
-            df = load_data_file(file_path)
+            df = load_data_file(file_path, dtype=CSV_DTYPES)
 
             if df is None or df.empty:
                 self.console.print(f"[red]❌ Arquivo vazio: {file_path}[/red]")
@@ -90,9 +185,10 @@ class LogAnalyzer:
                 required_cols = SUPPORTED_SCHEMAS[log_type]["required_columns"]
                 validate_required_columns(df, required_cols, log_type)
 
-            # Limpar e validar IPs
+            # Limpar e validar IPs (em colunas categóricas, map valida cada IP
+            # distinto uma única vez)
             if "source_ip" in df.columns:
-                df["source_ip"] = df["source_ip"].apply(clean_ip_address)
+                df["source_ip"] = df["source_ip"].map(clean_ip_address)
                 df = df[df["source_ip"] != ""]  # Remover IPs inválidos
 
             # Converter timestamps
@@ -102,6 +198,16 @@ class LogAnalyzer:
                     subset=["timestamp"]
                 )  # Remover registros com timestamp inválido
 
+            # Colunas de baixa cardinalidade viram categorias: filtros e
+            # agrupamentos passam a operar sobre códigos inteiros
+            categorical_columns = [
+                col for col in CATEGORICAL_COLUMNS if col in df.columns
+            ]
+            df = df.astype({col: "category" for col in categorical_columns})
+            for col in categorical_columns:
+                # Categorias lidas do arquivo podem ter sobrado dos filtros acima
+                df[col] = df[col].cat.remove_unused_categories()
+
             self.console.print(f"[green]✅ Arquivo carregado: {file_path}[/green]")
             self.console.print(f"[blue]📊 Total de registros: {len(df)}[/blue]")
 
@@ -114,12 +220,50 @@ class LogAnalyzer:
             self.console.print(f"[red]❌ Erro ao carregar {file_path}: {str(e)}[/red]")
             return None
 
-    def analyze_firewall_logs(self, df: pd.DataFrame) -> None:
+    @staticmethod
+    def filter_failed_attempts(df: pd.DataFrame) -> pd.DataFrame:
+        """
+        Filtra as tentativas de login falhadas
+
+        O resultado pode ser passado a analyze_auth_logs e detect_brute_force,
+        assim os mesmos logs são filtrados uma vez.
+
+        Args:
+            df: DataFrame com logs de autenticação
+
+        Returns:
+            DataFrame apenas com as tentativas falhadas
+        """
+        # Usar 'action' se não existir 'status'
+        status_col = "status" if "status" in df.columns else "action"
+        return df[df[status_col].isin(["FAIL", "FAILED"])]
+
+    @staticmethod
+    def filter_denied_attempts(df: pd.DataFrame) -> pd.DataFrame:
+        """
+        Filtra as tentativas negadas pelo firewall
+
+        Mesmo reaproveitamento de filter_failed_attempts, para
+        analyze_firewall_logs e detect_port_scanning.
+
+        Args:
+            df: DataFrame com logs de firewall
+
+        Returns:
+            DataFrame apenas com as tentativas negadas
+        """
+        return df[df["action"] == "DENY"]
+
+    def analyze_firewall_logs(
+        self, df: pd.DataFrame, denied_attempts: Optional[pd.DataFrame] = None
+    ) -> None:
         """
         Analisa logs de firewall
 
         Args:
             df: DataFrame com logs de firewall
+            denied_attempts: Resultado de filter_denied_attempts(df), se já
+                calculado
         """
         if df is None or df.empty:
             return
@@ -128,7 +272,8 @@ class LogAnalyzer:
         self.analysis_stats["firewall_logs"] = len(df)
 
         # Filtrar tentativas negadas
-        denied_attempts = df[df["action"] == "DENY"]
+        if denied_attempts is None:
+            denied_attempts = self.filter_denied_attempts(df)
 
         if denied_attempts.empty:
             self.console.print(
@@ -136,17 +281,21 @@ class LogAnalyzer:
             )
             return
 
-        # Agrupar por IP de origem
-        denied_by_ip = (
-            denied_attempts.groupby("source_ip")
-            .agg(
-                {
-                    "port": lambda x: list(x.unique()),
-                    "protocol": lambda x: list(x.unique()),
-                    "timestamp": "count",
-                }
-            )
-            .sort_values("timestamp", ascending=False)
+        # Contar por IP de origem; portas e protocolos são agregados apenas
+        # para os IPs exibidos na tabela
+        top_counts = (
+            denied_attempts.groupby("source_ip", observed=True)["timestamp"]
+            .count()
+            .sort_values(ascending=False)
+            .head(10)
+        )
+        top_attempts = denied_attempts[
+            denied_attempts["source_ip"].isin(top_counts.index)
+        ]
+        top_details = (
+            top_attempts.groupby("source_ip", observed=True)
+            .agg({"port": "unique", "protocol": "unique"})
+            .reindex(top_counts.index)
         )
 
         # Criar tabela de resultados
@@ -156,25 +305,32 @@ class LogAnalyzer:
         table.add_column("Portas Alvo", style="cyan")
         table.add_column("Protocolos", style="blue")
 
-        for ip, data in denied_by_ip.head(10).iterrows():
-            # Formatar portas (limitar para não quebrar tabela)
-            ports_str = ", ".join(map(str, sorted(data["port"])))
+        for ip, count, ports, protocols in zip(
+            top_counts.index, top_counts, top_details["port"], top_details["protocol"]
+        ):
+            # Formatar portas (limitar para não quebrar tabela). Dez portas já
+            # somam 28+ caracteres, então as demais nunca chegam a ser exibidas
+            ports_str = ", ".join(map(str, np.sort(ports)[:10]))
             if len(ports_str) > 25:
                 ports_str = ports_str[:22] + "..."
 
-            protocols_str = ", ".join(data["protocol"])
+            protocols_str = ", ".join(protocols)
 
-            table.add_row(ip, str(data["timestamp"]), ports_str, protocols_str)
+            table.add_row(ip, str(count), ports_str, protocols_str)
 
         self.console.print(table)
         self.console.print()
 
-    def analyze_auth_logs(self, df: pd.DataFrame) -> None:
+    def analyze_auth_logs(
+        self, df: pd.DataFrame, failed_attempts: Optional[pd.DataFrame] = None
+    ) -> None:
         """
         Analisa logs de autenticação
 
         Args:
             df: DataFrame com logs de autenticação
+            failed_attempts: Resultado de filter_failed_attempts(df), se já
+                calculado
         """
         if df is None or df.empty:
             return
@@ -182,9 +338,9 @@ class LogAnalyzer:
         self.logger.info("Iniciando análise de logs de autenticação")
         self.analysis_stats["auth_logs"] = len(df)
 
-        # Filtrar tentativas falhadas (usar 'action' se não existir 'status')
-        status_col = "status" if "status" in df.columns else "action"
-        failed_attempts = df[df[status_col].isin(["FAIL", "FAILED"])]
+        # Filtrar tentativas falhadas
+        if failed_attempts is None:
+            failed_attempts = self.filter_failed_attempts(df)
 
         if failed_attempts.empty:
             self.console.print(
@@ -192,15 +348,17 @@ class LogAnalyzer:
             )
             return
 
-        self.failed_logins = failed_attempts.to_dict("records")
+        # Guardar apenas a contagem por IP, sem materializar um dict por linha
+        counts = failed_attempts["source_ip"].value_counts(dropna=False)
+        self.failed_by_ip = counts[counts > 0]
 
         # Agrupar por IP
         failed_by_ip = (
-            failed_attempts.groupby("source_ip")
+            failed_attempts.groupby("source_ip", observed=True)
             .agg(
                 {
-                    "username": lambda x: list(x.unique()),
-                    "service": lambda x: list(x.unique()),
+                    "username": "unique",
+                    "service": "unique",
                     "timestamp": "count",
                 }
             )
@@ -214,14 +372,14 @@ class LogAnalyzer:
         table.add_column("Usuários Alvo", style="cyan")
         table.add_column("Serviços", style="blue")
 
-        for ip, data in failed_by_ip.head(10).iterrows():
-            users_str = ", ".join(data["username"][:3])
-            if len(data["username"]) > 3:
-                users_str += f"... (+{len(data['username']) - 3})"
+        for row in failed_by_ip.head(10).itertuples():
+            users_str = ", ".join(row.username[:3])
+            if len(row.username) > 3:
+                users_str += f"... (+{len(row.username) - 3})"
 
-            services_str = ", ".join(data["service"])
+            services_str = ", ".join(row.service)
 
-            table.add_row(ip, str(data["timestamp"]), users_str, services_str)
+            table.add_row(row.Index, str(row.timestamp), users_str, services_str)
 
         self.console.print(table)
         self.console.print()
@@ -238,17 +396,14 @@ class LogAnalyzer:
         """
         self.logger.info("Contando acessos por IP")
 
-        # Contar acessos de firewall
-        if df_firewall is not None and not df_firewall.empty:
-            for ip in df_firewall["source_ip"]:
-                if ip:  # Verificar se IP não está vazio
-                    self.ip_access_count[ip] += 1
-
-        # Contar acessos de autenticação
-        if df_auth is not None and not df_auth.empty:
-            for ip in df_auth["source_ip"]:
-                if ip:  # Verificar se IP não está vazio
-                    self.ip_access_count[ip] += 1
+        # Contar acessos de firewall e depois de autenticação, preservando a
+        # ordem de primeira aparição (desempate do ranking)
+        for df in (df_firewall, df_auth):
+            if df is not None and not df.empty:
+                ips, counts = _count_by_first_appearance(df["source_ip"])
+                self.ip_access_count.update(
+                    {ip: int(count) for ip, count in zip(ips, counts) if ip}
+                )
 
         if not self.ip_access_count:
             self.console.print(
@@ -279,17 +434,33 @@ class LogAnalyzer:
         self.console.print()
 
         # Atualizar estatísticas
-        self.analysis_stats["suspect_ips_found"] = sum(
-            1
-            for count in self.ip_access_count.values()
-            if count >= config["medium_threshold"]
+        self.analysis_stats["suspect_ips_found"] = self._count_ips_with_access(
+            config["medium_threshold"]
         )
 
+    def _count_ips_with_access(self, threshold: int) -> int:
+        """
+        Conta os IPs com pelo menos ``threshold`` acessos
+
+        Args:
+            threshold: Número mínimo de acessos
+
+        Returns:
+            Quantidade de IPs no limiar ou acima dele
+        """
+        counts = np.fromiter(
+            self.ip_access_count.values(),
+            dtype=np.int64,
+            count=len(self.ip_access_count),
+        )
+        return int(np.count_nonzero(counts >= threshold))
+
     def detect_brute_force(
         self,
         df: pd.DataFrame,
         time_window_minutes: Optional[int] = None,
         threshold: Optional[int] = None,
+        failed_attempts: Optional[pd.DataFrame] = None,
     ) -> None:
         """
         Detecta ataques de força bruta
@@ -298,6 +469,8 @@ class LogAnalyzer:
             df: DataFrame com logs de autenticação
             time_window_minutes: Janela de tempo em minutos
             threshold: Número mínimo de tentativas
+            failed_attempts: Resultado de filter_failed_attempts(df), se já
+                calculado
         """
         if df is None or df.empty:
             return
@@ -310,9 +483,9 @@ class LogAnalyzer:
             f"Detectando brute force: {min_attempts}+ tentativas em {time_window} min"
         )
 
-        # Filtrar tentativas falhadas (usar 'action' se não existir 'status')
-        status_col = "status" if "status" in df.columns else "action"
-        failed_attempts = df[df[status_col].isin(["FAIL", "FAILED"])].copy()
+        # Filtrar tentativas falhadas
+        if failed_attempts is None:
+            failed_attempts = self.filter_failed_attempts(df)
 
         if failed_attempts.empty:
             self.console.print(
@@ -320,44 +493,51 @@ class LogAnalyzer:
             )
             return
 
-        # Converter timestamps
-        failed_attempts["timestamp"] = pd.to_datetime(failed_attempts["timestamp"])
-        failed_attempts = failed_attempts.sort_values("timestamp")
+        # Converter timestamps (assign não altera o filtro recebido)
+        failed_attempts = failed_attempts.assign(
+            timestamp=pd.to_datetime(failed_attempts["timestamp"])
+        ).sort_values("timestamp")
 
         brute_force_detected = []
+        window_ns = np.int64(pd.Timedelta(minutes=time_window).value)
+
+        # Agrupar por IP em ordem de primeira aparição, mantendo a ordem
+        # temporal dentro de cada grupo (ordenação estável)
+        codes, ips = pd.factorize(failed_attempts["source_ip"])
+        valid = codes >= 0
+        order = np.argsort(codes[valid], kind="stable")
+        grouped_attempts = failed_attempts[valid].iloc[order]
+        sorted_codes = codes[valid][order]
+        timestamps = grouped_attempts["timestamp"].to_numpy("datetime64[ns]").view("i8")
+        group_starts = np.searchsorted(sorted_codes, np.arange(len(ips) + 1))
+
+        # Janela deslizante por IP: compilada com Numba (em paralelo entre IPs)
+        # para volumes grandes, busca binária com NumPy nos demais casos
+        if NUMBA_AVAILABLE and len(timestamps) >= NUMBA_MIN_ROWS:
+            from ._kernels import first_dense_windows
+        else:
+            first_dense_windows = _first_dense_windows_numpy
+        window_starts, window_ends = first_dense_windows(
+            timestamps, group_starts, window_ns, min_attempts
+        )
 
-        # Analisar por IP
-        for ip in failed_attempts["source_ip"].unique():
-            ip_attempts = failed_attempts[failed_attempts["source_ip"] == ip]
-
-            if len(ip_attempts) < min_attempts:
-                continue
-
-            # Verificar janelas de tempo
-            for i in range(len(ip_attempts) - min_attempts + 1):
-                window_start = ip_attempts.iloc[i]["timestamp"]
-                window_end = window_start + timedelta(minutes=time_window)
-
-                window_attempts = ip_attempts[
-                    (ip_attempts["timestamp"] >= window_start)
-                    & (ip_attempts["timestamp"] <= window_end)
-                ]
-
-                if len(window_attempts) >= min_attempts:
-                    # Brute force detectado
-                    attack_info = {
-                        "ip": ip,
-                        "start_time": window_start,
-                        "end_time": window_attempts["timestamp"].max(),
-                        "attempts": len(window_attempts),
-                        "duration": (
-                            window_attempts["timestamp"].max() - window_start
-                        ).total_seconds(),
-                        "users_targeted": list(window_attempts["username"].unique()),
-                        "services": list(window_attempts["service"].unique()),
-                    }
-                    brute_force_detected.append(attack_info)
-                    break  # Evitar duplicatas para o mesmo IP
+        # Brute force detectado (apenas a primeira janela por IP)
+        for code in np.flatnonzero(window_starts >= 0):
+            window_attempts = grouped_attempts.iloc[
+                window_starts[code] : window_ends[code]
+            ]
+            window_start = window_attempts["timestamp"].iloc[0]
+            window_end = window_attempts["timestamp"].iloc[-1]
+            attack_info = {
+                "ip": ips[code],
+                "start_time": window_start,
+                "end_time": window_end,
+                "attempts": len(window_attempts),
+                "duration": (window_end - window_start).total_seconds(),
+                "users_targeted": list(window_attempts["username"].unique()),
+                "services": list(window_attempts["service"].unique()),
+            }
+            brute_force_detected.append(attack_info)
 
         if not brute_force_detected:
             self.console.print(
@@ -406,6 +586,7 @@ class LogAnalyzer:
         df: pd.DataFrame,
         time_window_minutes: Optional[int] = None,
         min_ports: Optional[int] = None,
+        denied_attempts: Optional[pd.DataFrame] = None,
     ) -> None:
         """
         Detecta varreduras de portas
@@ -414,6 +595,8 @@ class LogAnalyzer:
             df: DataFrame com logs de firewall
             time_window_minutes: Janela de tempo em minutos
             min_ports: Número mínimo de portas
+            denied_attempts: Resultado de filter_denied_attempts(df), se já
+                calculado
         """
         if df is None or df.empty:
             return
@@ -427,7 +610,8 @@ class LogAnalyzer:
         )
 
         # Filtrar tentativas negadas (mais indicativo de scanning)
-        denied_attempts = df[df["action"] == "DENY"].copy()
+        if denied_attempts is None:
+            denied_attempts = self.filter_denied_attempts(df)
 
         if denied_attempts.empty:
             self.console.print(
@@ -435,42 +619,53 @@ class LogAnalyzer:
             )
             return
 
-        # Converter timestamps
-        denied_attempts["timestamp"] = pd.to_datetime(denied_attempts["timestamp"])
-        denied_attempts = denied_attempts.sort_values("timestamp")
+        # Converter timestamps (assign não altera o filtro recebido)
+        denied_attempts = denied_attempts.assign(
+            timestamp=pd.to_datetime(denied_attempts["timestamp"])
+        ).sort_values("timestamp")
 
         port_scan_detected = []
 
-        # Analisar por IP
-        for ip in denied_attempts["source_ip"].unique():
-            ip_attempts = denied_attempts[denied_attempts["source_ip"] == ip]
-
-            # Contar portas únicas
-            unique_ports = ip_attempts["port"].nunique()
-            if unique_ports < threshold:
-                continue
-
-            # Analisar janelas de tempo
-            start_time = ip_attempts["timestamp"].min()
-            end_time = ip_attempts["timestamp"].max()
-            duration = (end_time - start_time).total_seconds()
-
-            # Se a duração for menor que a janela, considerar como port scan
-            if duration <= (time_window * 60):
-                scan_info = {
-                    "ip": ip,
-                    "start_time": start_time,
-                    "end_time": end_time,
-                    "duration": duration,
-                    "unique_ports": unique_ports,
-                    "ports_scanned": sorted(ip_attempts["port"].unique().tolist()),
-                    "total_attempts": len(ip_attempts),
-                    "target_hosts": list(ip_attempts["destination_ip"].unique()),
-                    "protocols": list(ip_attempts["protocol"].unique()),
-                    "scan_rate": (unique_ports / duration * 60) if duration > 0 else 0,
-                    "actions": ip_attempts["action"].value_counts().to_dict(),
-                }
-                port_scan_detected.append(scan_info)
+        # Portas únicas e intervalo de tempo de todos os IPs em uma única
+        # passagem; os detalhes são montados apenas para os IPs suspeitos
+        by_ip = denied_attempts.groupby("source_ip", sort=False, observed=True)
+        ip_stats = by_ip.agg(
+            unique_ports=("port", "nunique"),
+            start_time=("timestamp", "min"),
+            end_time=("timestamp", "max"),
+        )
+        ip_stats["duration"] = (
+            ip_stats["end_time"] - ip_stats["start_time"]
+        ).dt.total_seconds()
+
+        # Se a duração for menor que a janela, considerar como port scan
+        suspects = ip_stats[
+            (ip_stats["unique_ports"] >= threshold)
+            & (ip_stats["duration"] <= time_window * 60)
+        ]
+
+        for ip, stats in zip(suspects.index, suspects.itertuples(index=False)):
+            ip_attempts = by_ip.get_group(ip)
+            unique_ports = int(stats.unique_ports)
+            duration = float(stats.duration)
+
+            scan_info = {
+                "ip": ip,
+                "start_time": stats.start_time,
+                "end_time": stats.end_time,
+                "duration": duration,
+                "unique_ports": unique_ports,
+                "ports_scanned": sorted(ip_attempts["port"].unique().tolist()),
+                "total_attempts": len(ip_attempts),
+                "target_hosts": list(ip_attempts["destination_ip"].unique()),
+                "protocols": list(ip_attempts["protocol"].unique()),
+                "scan_rate": (unique_ports / duration * 60) if duration > 0 else 0,
+                "actions": ip_attempts["action"]
+                .value_counts()
+                .loc[lambda counts: counts > 0]
+                .to_dict(),
+            }
+            port_scan_detected.append(scan_info)
 
         if not port_scan_detected:
             self.console.print(
@@ -568,6 +763,15 @@ class LogAnalyzer:
 
             self.console.print(panel)
 
+    def analyze_geographic_patterns(self) -> None:
+        """
+        Executa a análise geográfica dos IPs suspeitos
+
+        Apenas os IPs do registro de suspeitos são geolocalizados, e não
+        todos os IPs distintos dos logs carregados.
+        """
+        self._run_geographic_analysis(GeographicAnalyzer(self.config, self.console))
+
     def _run_geographic_analysis(self, geo_analyzer):
         """
         Executa análise geográfica usando o GeographicAnalyzer
@@ -575,27 +779,78 @@ class LogAnalyzer:
         Args:
             geo_analyzer: Instância do GeographicAnalyzer
         """
-        # Coletar IPs suspeitos
-        suspect_ips = set()
+        # IPs suspeitos: detecções e IPs a partir do limiar médio de acessos
+        suspect_ips = set(self._build_suspect_registry()["ip"])
 
-        # Adicionar IPs de ataques de brute force
-        for attack in self.brute_force_attempts:
-            if "ip" in attack:
-                suspect_ips.add(attack["ip"])
+        # Executar análise geográfica
+        geo_analyzer.analyze_geographic_patterns(suspect_ips)
+
+    def _build_suspect_registry(self) -> pd.DataFrame:
+        """
+        Monta o registro de IPs suspeitos a partir de todas as detecções
 
-        # Adicionar IPs de port scanning
-        for scan in self.port_scan_attempts:
-            if "ip" in scan:
-                suspect_ips.add(scan["ip"])
+        Uma linha por alerta: brute force, port scanning e, para IPs ainda não
+        listados, alto volume de acessos (a partir do limiar médio de risco).
 
-        # Adicionar IPs com muitos acessos
+        Returns:
+            DataFrame com as colunas de SUSPECT_COLUMNS
+        """
+        date_format = "%Y-%m-%d %H:%M:%S"
+        detections = [
+            (
+                attack["ip"],
+                "Brute Force",
+                attack["attempts"],
+                attack["start_time"].strftime(date_format),
+                attack["end_time"].strftime(date_format),
+                ", ".join(attack["services"]),
+                ", ".join(attack["users_targeted"][:5]),
+            )
+            for attack in self.brute_force_attempts
+        ] + [
+            (
+                scan["ip"],
+                "Port Scanning",
+                scan["total_attempts"],
+                scan["start_time"].strftime(date_format),
+                scan["end_time"].strftime(date_format),
+                f"{scan['unique_ports']} portas",
+                ", ".join(scan["target_hosts"]),
+            )
+            for scan in self.port_scan_attempts
+        ]
+        registry = pd.DataFrame(detections, columns=SUSPECT_COLUMNS)
+
+        # IPs com alto número de acessos, na ordem de most_common()
         config = self.config["risk_classification"]
-        for ip, count in self.ip_access_count.items():
-            if count >= config["medium_threshold"]:
-                suspect_ips.add(ip)
+        access_counts = pd.Series(self.ip_access_count, dtype="int64").sort_values(
+            ascending=False, kind="stable"
+        )
+        access_counts = access_counts[
+            (access_counts >= config["medium_threshold"])
+            & ~access_counts.index.isin(registry["ip"])
+        ]
+        if not access_counts.empty:
+            now = datetime.now().strftime(date_format)
+            high_volume = pd.DataFrame(
+                {
+                    "ip": access_counts.index,
+                    "tipo_de_alerta": "Alto Volume",
+                    "ocorrencias": access_counts.to_numpy(),
+                    "primeira_deteccao": now,
+                    "ultima_deteccao": now,
+                    "servicos_afetados": "Múltiplos",
+                    "usuarios_alvo": "N/A",
+                }
+            )
+            registry = (
+                pd.concat([registry, high_volume], ignore_index=True)
+                if not registry.empty
+                else high_volume
+            )
 
-        # Executar análise geográfica
-        geo_analyzer.analyze_geographic_patterns(suspect_ips)
+        self.suspect_registry = registry
+        return registry
 
     def export_suspect_ips_csv(self, output_file: str) -> None:
         """
@@ -604,107 +859,36 @@ class LogAnalyzer:
         Args:
             output_file: Caminho para o arquivo de saída
         """
-        import csv
-        from datetime import datetime
-
         try:
-            # Coletar dados de IPs suspeitos
-            suspect_data = []
-
-            # IPs de brute force
-            for attack in self.brute_force_attempts:
-                suspect_data.append(
-                    {
-                        "ip": attack["ip"],
-                        "tipo_de_alerta": "Brute Force",
-                        "ocorrencias": attack["attempts"],
-                        "primeira_deteccao": attack["start_time"].strftime(
-                            "%Y-%m-%d %H:%M:%S"
-                        ),
-                        "ultima_deteccao": attack["end_time"].strftime(
-                            "%Y-%m-%d %H:%M:%S"
-                        ),
-                        "servicos_afetados": ", ".join(attack["services"]),
-                        "usuarios_alvo": ", ".join(attack["users_targeted"][:5]),
-                    }
-                )
-
-            # IPs de port scanning
-            for scan in self.port_scan_attempts:
-                suspect_data.append(
-                    {
-                        "ip": scan["ip"],
-                        "tipo_de_alerta": "Port Scanning",
-                        "ocorrencias": scan["total_attempts"],
-                        "primeira_deteccao": scan["start_time"].strftime(
-                            "%Y-%m-%d %H:%M:%S"
-                        ),
-                        "ultima_deteccao": scan["end_time"].strftime(
-                            "%Y-%m-%d %H:%M:%S"
-                        ),
-                        "servicos_afetados": f"{scan['unique_ports']} portas",
-                        "usuarios_alvo": ", ".join(scan["target_hosts"]),
-                    }
-                )
-
-            # IPs com alto número de acessos
+            # Detecções e IPs a partir do limiar alto de acessos
+            registry = self._build_suspect_registry()
             config = self.config["risk_classification"]
-            for ip, count in self.ip_access_count.most_common():
-                if count >= config["high_threshold"]:
-                    # Verificar se já não está na lista
-                    if not any(item["ip"] == ip for item in suspect_data):
-                        suspect_data.append(
-                            {
-                                "ip": ip,
-                                "tipo_de_alerta": "Alto Volume",
-                                "ocorrencias": count,
-                                "primeira_deteccao": datetime.now().strftime(
-                                    "%Y-%m-%d %H:%M:%S"
-                                ),
-                                "ultima_deteccao": datetime.now().strftime(
-                                    "%Y-%m-%d %H:%M:%S"
-                                ),
-                                "servicos_afetados": "Múltiplos",
-                                "usuarios_alvo": "N/A",
-                            }
-                        )
+            suspects = registry[
+                (registry["tipo_de_alerta"] != "Alto Volume")
+                | (registry["ocorrencias"] >= config["high_threshold"])
+            ]
 
-            if not suspect_data:
+            if suspects.empty:
                 self.console.print(
                     "[yellow]⚠️ Nenhum IP suspeito encontrado para exportar[/yellow]"
                 )
                 return
 
             # Escrever arquivo CSV
-            with open(output_file, "w", newline="", encoding="utf-8") as csvfile:
-                fieldnames = [
-                    "ip",
-                    "tipo_de_alerta",
-                    "ocorrencias",
-                    "primeira_deteccao",
-                    "ultima_deteccao",
-                    "servicos_afetados",
-                    "usuarios_alvo",
-                ]
-                writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
-
-                writer.writeheader()
-                for row in suspect_data:
-                    writer.writerow(row)
+            suspects.to_csv(
+                output_file, index=False, encoding="utf-8", lineterminator="\r\n"
+            )
 
             # Mostrar confirmação
             export_text = Text()
             export_text.append("📄 EXPORTAÇÃO CONCLUÍDA\n\n", style="bold green")
             export_text.append(f"✅ Arquivo: {output_file}\n", style="cyan")
             export_text.append(
-                f"📊 Total de IPs suspeitos: {len(suspect_data)}\n", style="yellow"
+                f"📊 Total de IPs suspeitos: {len(suspects)}\n", style="yellow"
             )
 
             # Estatísticas por tipo
-            alert_types = {}
-            for item in suspect_data:
-                alert_type = item["tipo_de_alerta"]
-                alert_types[alert_type] = alert_types.get(alert_type, 0) + 1
+            alert_types = Counter(suspects["tipo_de_alerta"])
 
             export_text.append("\n📈 Distribuição por tipo:\n", style="white")
             for alert_type, count in alert_types.items():
@@ -735,9 +919,9 @@ class LogAnalyzer:
             style="white",
         )
 
-        if self.failed_logins:
+        if not self.failed_by_ip.empty:
             summary_text.append(
-                f"🚫 Total de tentativas de login falhadas: {len(self.failed_logins)}\n",
+                f"🚫 Total de tentativas de login falhadas: {self.failed_by_ip.sum()}\n",
                 style="red",
             )
 
@@ -792,10 +976,8 @@ class LogAnalyzer:
             )
 
         if self.ip_access_count:
-            high_risk_count = sum(
-                1
-                for count in self.ip_access_count.values()
-                if count >= self.config["risk_classification"]["high_threshold"]
+            high_risk_count = self._count_ips_with_access(
+                self.config["risk_classification"]["high_threshold"]
             )
             if high_risk_count > 0:
                 summary_text.append(
@@ -954,6 +1136,28 @@ class LogAnalyzer:
 
         return stats
 
+    def get_report(self) -> Dict[str, Any]:
+        """
+        Reúne os resultados da análise em um dicionário serializável
+
+        Returns:
+            Dicionário com estatísticas, ataques detectados e IPs mais ativos
+        """
+        return {
+            "summary": {
+                **self.analysis_stats,
+                "failed_logins": int(self.failed_by_ip.sum()),
+                "brute_force_attacks": len(self.brute_force_attempts),
+                "port_scans": len(self.port_scan_attempts),
+            },
+            "brute_force_attempts": self.brute_force_attempts,
+            "port_scan_attempts": self.port_scan_attempts,
+            "top_ips": [
+                {"ip": ip, "count": count}
+                for ip, count in self.ip_access_count.most_common(15)
+            ],
+        }
+
     def export_results(self, output_file: str, data) -> bool:
         """
         Exporta resultados para arquivo
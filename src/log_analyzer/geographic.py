@@ -3,11 +3,17 @@ Módulo de análise geográfica do Log Analyzer
 """
 
 import json
+import sqlite3
+import threading
 import time
 from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any, Dict, List, Optional, Set
 
+import numpy as np
+import pandas as pd
 import requests
+from requests.adapters import HTTPAdapter
 from rich import box
 from rich.console import Console
 from rich.panel import Panel
@@ -15,6 +21,27 @@ from rich.table import Table
 from rich.text import Text
 
 from .config import DEFAULT_CONFIG
+from .utils import PYARROW_AVAILABLE
+
+# Campos solicitados à API de geolocalização ("query" identifica o IP no lote)
+GEO_API_FIELDS = (
+    "status,message,query,country,countryCode,region,regionName,city,"
+    "lat,lon,isp,org,as"
+)
+
+# Termos que indicam VPN/proxy/hosting no nome da organização
+SUSPICIOUS_ORG_PATTERN = "proxy|vpn|hosting|server|datacenter"
+
+# Colunas de texto dos dados geográficos usadas nos filtros e na exibição
+GEO_TEXT_COLUMNS = (
+    "ip",
+    "country",
+    "country_code",
+    "region",
+    "city",
+    "isp",
+    "organization",
+)
 
 
 class GeographicAnalyzer:
@@ -40,7 +67,28 @@ class GeographicAnalyzer:
         self.timeout = geo_config["timeout_seconds"]
         self.api_url = geo_config["api_url"]
         self.rate_limit_delay = geo_config["rate_limit_delay"]
-        self.high_risk_countries = geo_config["high_risk_countries"]
+        self.max_workers = geo_config.get("max_workers", 20)
+        # Conjunto: a pertinência é consultada para cada IP analisado
+        self.high_risk_countries = frozenset(geo_config["high_risk_countries"])
+        self.batch_api_url = geo_config.get("batch_api_url", "http://ip-api.com/batch")
+        self.batch_size = geo_config.get("batch_size", 100)
+        self.batch_rate_limit_delay = geo_config.get("batch_rate_limit_delay", 4.0)
+        self.cache_file = geo_config.get("cache_file")
+        self.cache_ttl_seconds = geo_config.get("cache_ttl_hours", 24) * 3600
+
+        # Consultas individuais podem rodar em paralelo: o lock protege o
+        # cache e o relógio do rate limiting é compartilhado entre as threads
+        self._cache_lock = threading.Lock()
+        self._rate_limit_lock = threading.Lock()
+        self._next_request_at = 0.0
+        self._cache_conn = self._load_persistent_cache()
+
+        # Sessão persistente: as consultas reaproveitam conexões TCP abertas
+        # (keep-alive), com uma conexão no pool para cada thread de consulta
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_maxsize=self.max_workers)
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
 
     def get_ip_location(self, ip_address: str) -> Optional[Dict[str, Any]]:
         """
@@ -64,31 +112,23 @@ class GeographicAnalyzer:
             return None
 
         try:
+            # Rate limiting
+            self._wait_for_rate_limit()
+
             # Fazer requisição para API
-            url = f"{self.api_url}/{ip_address}?fields=status,message,country,countryCode,region,regionName,city,lat,lon,isp,org,as"
-            response = requests.get(url, timeout=self.timeout)
+            url = f"{self.api_url}/{ip_address}?fields={GEO_API_FIELDS}"
+            response = self.session.get(url, timeout=self.timeout)
 
             if response.status_code == 200:
                 data = response.json()
 
                 if data.get("status") == "success":
-                    location_info = {
-                        "country": data.get("country", "Desconhecido"),
-                        "country_code": data.get("countryCode", "XX"),
-                        "region": data.get("regionName", "Desconhecido"),
-                        "city": data.get("city", "Desconhecido"),
-                        "latitude": data.get("lat", 0.0),
-                        "longitude": data.get("lon", 0.0),
-                        "isp": data.get("isp", "Desconhecido"),
-                        "organization": data.get("org", "Desconhecido"),
-                        "as_info": data.get("as", "Desconhecido"),
-                    }
+                    location_info = self._parse_location(data)
 
                     # Adicionar ao cache
-                    self.ip_location_cache[ip_address] = location_info
-
-                    # Rate limiting
-                    time.sleep(self.rate_limit_delay)
+                    with self._cache_lock:
+                        self.ip_location_cache[ip_address] = location_info
+                        self._persist_locations({ip_address: location_info})
 
                     return location_info
                 else:
@@ -123,6 +163,183 @@ class GeographicAnalyzer:
 
         return None
 
+    def _wait_for_rate_limit(self) -> None:
+        """
+        Espaça o início das consultas individuais em ``rate_limit_delay``
+
+        Cada thread reserva o próximo horário livre e espera apenas até ele,
+        então a latência das requisições se sobrepõe sem exceder o limite.
+        """
+        with self._rate_limit_lock:
+            now = time.monotonic()
+            start_at = max(now, self._next_request_at)
+            self._next_request_at = start_at + self.rate_limit_delay
+
+        if start_at > now:
+            time.sleep(start_at - now)
+
+    def locate_ips(self, ip_list: List[str]) -> List[Optional[Dict[str, Any]]]:
+        """
+        Obtém a localização de vários IPs
+
+        Usa o endpoint em lote e consulta em paralelo (``max_workers``
+        threads) os IPs que continuarem fora do cache.
+
+        Args:
+            ip_list: Lista de endereços IP
+
+        Returns:
+            Localizações na mesma ordem de ``ip_list`` (None quando indisponível)
+        """
+        self._batch_geolocate(ip_list)
+
+        pending = [
+            ip for ip in dict.fromkeys(ip_list) if ip not in self.ip_location_cache
+        ]
+        located = {}
+        if pending:
+            with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+                located = dict(
+                    zip(pending, executor.map(self.get_ip_location, pending))
+                )
+
+        return [
+            located[ip] if ip in located else self.ip_location_cache.get(ip)
+            for ip in ip_list
+        ]
+
+    def _batch_geolocate(self, ip_list: List[str]) -> None:
+        """
+        Consulta a geolocalização de vários IPs pelo endpoint em lote da API
+
+        Cada requisição resolve até ``batch_size`` IPs de uma vez, em vez de
+        uma requisição (e uma pausa de rate limit) por IP. Os resultados vão
+        para o cache; IPs sem localização são armazenados como None para não
+        serem consultados de novo. Em caso de falha, os IPs restantes ficam
+        fora do cache e serão consultados individualmente.
+
+        Args:
+            ip_list: Lista de endereços IP
+        """
+        if not self.enabled:
+            return
+
+        pending = [
+            ip
+            for ip in dict.fromkeys(ip_list)
+            if ip not in self.ip_location_cache and not self._is_private_ip(ip)
+        ]
+
+        for start in range(0, len(pending), self.batch_size):
+            if start:
+                # Rate limiting (o endpoint em lote tem limite próprio)
+                time.sleep(self.batch_rate_limit_delay)
+
+            batch = pending[start : start + self.batch_size]
+
+            try:
+                response = self.session.post(
+                    f"{self.batch_api_url}?fields={GEO_API_FIELDS}",
+                    json=batch,
+                    timeout=self.timeout,
+                )
+                response.raise_for_status()
+                results = response.json()
+                if not isinstance(results, list):
+                    raise ValueError("resposta inesperada da API")
+            except (requests.exceptions.RequestException, ValueError) as e:
+                self.console.print(
+                    f"[yellow]⚠️ Erro na geolocalização em lote: {type(e).__name__} - {str(e)}[/yellow]"
+                )
+                return
+
+            resolved = {}
+            for ip, data in zip(batch, results):
+                if data.get("status") == "success":
+                    resolved[ip] = self._parse_location(data)
+                else:
+                    self.console.print(
+                        f"[yellow]⚠️ Erro na geolocalização de {ip}: {data.get('message', 'Erro desconhecido')}[/yellow]"
+                    )
+                    resolved[ip] = None
+
+            with self._cache_lock:
+                self.ip_location_cache.update(resolved)
+                self._persist_locations(resolved)
+
+    def _load_persistent_cache(self) -> Optional[sqlite3.Connection]:
+        """
+        Abre o cache SQLite de localizações e carrega as entradas válidas
+
+        Returns:
+            Conexão com o cache ou None se desativado/indisponível
+        """
+        if not self.enabled or not self.cache_file:
+            return None
+
+        try:
+            conn = sqlite3.connect(self.cache_file, check_same_thread=False)
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS ip_cache "
+                "(ip TEXT PRIMARY KEY, data TEXT, ts INTEGER)"
+            )
+            rows = conn.execute(
+                "SELECT ip, data FROM ip_cache WHERE ts > ?",
+                (int(time.time() - self.cache_ttl_seconds),),
+            )
+            for ip, data in rows:
+                self.ip_location_cache[ip] = json.loads(data)
+            return conn
+        except (sqlite3.Error, ValueError) as e:
+            self.console.print(
+                f"[yellow]⚠️ Cache de geolocalização indisponível ({self.cache_file}): {e}[/yellow]"
+            )
+            return None
+
+    def _persist_locations(
+        self, locations: Dict[str, Optional[Dict[str, Any]]]
+    ) -> None:
+        """
+        Grava localizações no cache SQLite (falhas mantêm apenas o cache em memória)
+
+        Args:
+            locations: Dicionário {ip: informações de localização ou None}
+        """
+        if self._cache_conn is None or not locations:
+            return
+
+        now = int(time.time())
+        try:
+            with self._cache_conn:
+                self._cache_conn.executemany(
+                    "INSERT OR REPLACE INTO ip_cache (ip, data, ts) VALUES (?, ?, ?)",
+                    [(ip, json.dumps(info), now) for ip, info in locations.items()],
+                )
+        except sqlite3.Error:
+            self._cache_conn = None
+
+    def _parse_location(self, data: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Converte a resposta da API de geolocalização para o formato interno
+
+        Args:
+            data: Resposta da API para um IP
+
+        Returns:
+            Dicionário com informações de localização
+        """
+        return {
+            "country": data.get("country", "Desconhecido"),
+            "country_code": data.get("countryCode", "XX"),
+            "region": data.get("regionName", "Desconhecido"),
+            "city": data.get("city", "Desconhecido"),
+            "latitude": data.get("lat", 0.0),
+            "longitude": data.get("lon", 0.0),
+            "isp": data.get("isp", "Desconhecido"),
+            "organization": data.get("org", "Desconhecido"),
+            "as_info": data.get("as", "Desconhecido"),
+        }
+
     def _is_private_ip(self, ip: str) -> bool:
         """
         Verifica se o IP é privado/reservado
@@ -178,11 +395,11 @@ class GeographicAnalyzer:
         self.console.print(f"🔍 Analisando {len(suspect_ips)} IPs suspeitos...\n")
 
         # Coletar dados geográficos
+        ips = list(suspect_ips)
         geo_data = []
         countries_count = Counter()
 
-        for ip in suspect_ips:
-            location = self.get_ip_location(ip)
+        for ip, location in zip(ips, self.locate_ips(ips)):
             if location:
                 geo_data.append({"ip": ip, **location})
                 countries_count[location["country"]] += 1
@@ -193,14 +410,34 @@ class GeographicAnalyzer:
             )
             return
 
+        # Fatores de risco calculados uma vez, por coluna, para todos os IPs
+        geo_df = pd.DataFrame(geo_data)
+        if PYARROW_AVAILABLE:
+            # Texto em Arrow faz .str.contains/.isin rodarem nos kernels do
+            # pyarrow.compute. É o padrão do pandas 3; no 2.x chega como object
+            text_columns = [
+                col
+                for col in GEO_TEXT_COLUMNS
+                if col in geo_df and geo_df[col].dtype == object
+            ]
+            geo_df[text_columns] = (
+                geo_df[text_columns].fillna("Desconhecido").astype("string[pyarrow]")
+            )
+        geo_df["high_risk_country"] = geo_df["country_code"].isin(
+            self.high_risk_countries
+        )
+        geo_df["suspicious_org"] = geo_df["organization"].str.contains(
+            SUSPICIOUS_ORG_PATTERN, case=False, regex=True, na=False
+        )
+
         # Mostrar distribuição por país
         self._display_country_distribution(countries_count, len(geo_data))
 
         # Mostrar detalhes por IP
-        self._display_ip_details(geo_data)
+        self._display_ip_details(geo_df)
 
         # Mostrar recomendações
-        self._display_recommendations(geo_data)
+        self._display_recommendations(geo_df)
 
     def _display_country_distribution(
         self, countries_count: Counter, total_ips: int
@@ -215,15 +452,17 @@ class GeographicAnalyzer:
         table.add_column("Percentual", style="green", justify="center")
         table.add_column("Status", style="white", justify="center")
 
+        # Código de cada país, montado em uma única passada pelo cache
+        country_codes = {}
+        for geo_item in self.ip_location_cache.values():
+            if geo_item:
+                country_codes.setdefault(
+                    geo_item.get("country"), geo_item.get("country_code", "XX")
+                )
+
         for country, count in countries_count.most_common():
             percentage = (count / total_ips) * 100
-
-            # Encontrar código do país
-            country_code = "XX"
-            for geo_item in self.ip_location_cache.values():
-                if geo_item and geo_item.get("country") == country:
-                    country_code = geo_item.get("country_code", "XX")
-                    break
+            country_code = country_codes.get(country, "XX")
 
             # Determinar status de risco
             if country_code in self.high_risk_countries:
@@ -240,7 +479,7 @@ class GeographicAnalyzer:
         self.console.print(table)
         self.console.print()
 
-    def _display_ip_details(self, geo_data: List[Dict[str, Any]]) -> None:
+    def _display_ip_details(self, geo_df: pd.DataFrame) -> None:
         """Exibe detalhes geográficos de cada IP"""
         self.console.print("🔍 DETALHES GEOGRÁFICOS DOS IPS\n", style="bold yellow")
 
@@ -252,43 +491,42 @@ class GeographicAnalyzer:
         table.add_column("Coordenadas", style="green")
         table.add_column("Risco", style="red", justify="center")
 
-        for item in geo_data:
-            # Calcular fatores de risco
-            risk_factors = []
-
-            if item["country_code"] in self.high_risk_countries:
-                risk_factors.append("País Alto Risco")
-
-            org_lower = item["organization"].lower()
-            if any(
-                term in org_lower
-                for term in ["proxy", "vpn", "hosting", "server", "datacenter"]
-            ):
-                risk_factors.append("VPN/Proxy/Hosting")
-
-            # Determinar nível de risco
-            if len(risk_factors) >= 2:
-                risk_level = "🚨 Alto"
-            elif len(risk_factors) == 1:
-                risk_level = "⚠️ Médio"
-            else:
-                risk_level = "✅ Baixo"
-
-            # Formatar dados para exibição
-            location = f"{item['country']}/{item['region']}"
-            coords = f"{item['latitude']:.2f}, {item['longitude']:.2f}"
-            isp_truncated = (
-                item["isp"][:25] + "..." if len(item["isp"]) > 25 else item["isp"]
-            )
+        # Nível de risco pelo número de fatores presentes
+        risk_factors = geo_df["high_risk_country"].astype("int8") + geo_df[
+            "suspicious_org"
+        ].astype("int8")
+        risk_levels = np.select(
+            [risk_factors >= 2, risk_factors == 1], ["🚨 Alto", "⚠️ Médio"], "✅ Baixo"
+        )
 
+        # Formatar dados para exibição
+        locations = geo_df["country"] + "/" + geo_df["region"]
+        isp = geo_df["isp"]
+        isp_truncated = isp.where(isp.str.len() <= 25, isp.str.slice(0, 25) + "...")
+
+        for ip, location, city, isp_name, lat, lon, risk_level in zip(
+            geo_df["ip"],
+            locations,
+            geo_df["city"],
+            isp_truncated,
+            geo_df["latitude"],
+            geo_df["longitude"],
+            risk_levels,
+        ):
+            # Text evita o parsing de markup por célula (e "[...]" em nomes de ISP)
             table.add_row(
-                item["ip"], location, item["city"], isp_truncated, coords, risk_level
+                Text(ip),
+                Text(location),
+                Text(city),
+                Text(isp_name),
+                Text(f"{lat:.2f}, {lon:.2f}"),
+                Text(risk_level),
             )
 
         self.console.print(table)
         self.console.print()
 
-    def _display_recommendations(self, geo_data: List[Dict[str, Any]]) -> None:
+    def _display_recommendations(self, geo_df: pd.DataFrame) -> None:
         """Exibe recomendações baseadas na análise geográfica"""
         recommendations = Text()
         recommendations.append(
@@ -296,52 +534,42 @@ class GeographicAnalyzer:
         )
 
         # IPs de países de alto risco
-        high_risk_ips = [
-            item
-            for item in geo_data
-            if item["country_code"] in self.high_risk_countries
-        ]
+        high_risk_ips = geo_df[geo_df["high_risk_country"]]
 
-        if high_risk_ips:
+        if not high_risk_ips.empty:
             recommendations.append(
                 "🚨 IPs de países de alto risco detectados:\n", style="bold red"
             )
-            for item in high_risk_ips[:5]:  # Mostrar apenas os primeiros 5
-                recommendations.append(
-                    f"   • {item['ip']} ({item['country']})\n", style="red"
-                )
+            # Mostrar apenas os primeiros 5
+            for ip, country in zip(
+                high_risk_ips["ip"].head(5), high_risk_ips["country"].head(5)
+            ):
+                recommendations.append(f"   • {ip} ({country})\n", style="red")
             recommendations.append("\n")
 
         # IPs usando VPN/Proxy/Hosting
-        suspicious_orgs = [
-            item
-            for item in geo_data
-            if any(
-                term in item["organization"].lower()
-                for term in ["proxy", "vpn", "hosting", "server", "datacenter"]
-            )
-        ]
+        suspicious_orgs = geo_df[geo_df["suspicious_org"]]
 
-        if suspicious_orgs:
+        if not suspicious_orgs.empty:
             recommendations.append(
                 "🔒 IPs suspeitos por tipo de organização:\n", style="bold yellow"
             )
-            for item in suspicious_orgs[:3]:
-                recommendations.append(
-                    f"   • {item['ip']} - {item['organization']}\n", style="yellow"
-                )
+            for ip, organization in zip(
+                suspicious_orgs["ip"].head(3), suspicious_orgs["organization"].head(3)
+            ):
+                recommendations.append(f"   • {ip} - {organization}\n", style="yellow")
             recommendations.append("\n")
 
         # Recomendações gerais
         recommendations.append("🛡️ Ações recomendadas:\n", style="bold white")
 
-        if high_risk_ips:
+        if not high_risk_ips.empty:
             recommendations.append(
                 "   • Implementar geo-blocking para países de alto risco\n",
                 style="white",
             )
 
-        if suspicious_orgs:
+        if not suspicious_orgs.empty:
             recommendations.append(
                 "   • Monitorar conexões através de VPN/Proxy/Hosting\n", style="white"
             )
@@ -358,8 +586,7 @@ class GeographicAnalyzer:
         )
 
         # Estatísticas de concentração
-        countries_count = Counter(item["country"] for item in geo_data)
-        if countries_count.most_common(1)[0][1] > len(geo_data) * 0.5:
+        if geo_df["country"].value_counts().iloc[0] > len(geo_df) * 0.5:
             recommendations.append(
                 "   • Avaliar bloqueio temporário do país com maior concentração\n",
                 style="white",
@@ -386,8 +613,7 @@ class GeographicAnalyzer:
         """
         results = []
 
-        for ip in ip_list:
-            location_info = self.get_ip_location(ip)
+        for ip, location_info in zip(ip_list, self.locate_ips(ip_list)):
             if location_info:
                 results.append(
                     {
@@ -21,17 +21,15 @@ Versão: 2.0
 """
 
 import argparse
+import json
 import os
 import sys
 from pathlib import Path
 
-import pandas as pd
 from rich.console import Console
 from rich.panel import Panel
 
 from .config import DEFAULT_CONFIG
-from .core import LogAnalyzer
-from .utils import ensure_directory_exists, validate_file_format
 
 console = Console()
 
@@ -84,12 +82,43 @@ def validate_arguments(args):
 
 def setup_export_directory():
     """Configura diretório de exportação"""
+    from .utils import ensure_directory_exists
+
     base_dir = Path(__file__).parent.parent.parent
     exports_dir = base_dir / "exports"
     ensure_directory_exists(exports_dir)
     return exports_dir
 
 
+def convert_inputs_to_parquet(args) -> int:
+    """
+    Converte os arquivos de entrada para Parquet
+
+    Args:
+        args: Argumentos da linha de comando
+
+    Returns:
+        Código de saída do programa
+    """
+    from .core import CSV_DTYPES
+    from .utils import convert_to_parquet
+
+    if args.samples or args.samples_json:
+        input_files = get_sample_files("json" if args.samples_json else "csv")
+    else:
+        input_files = (args.firewall, args.auth)
+
+    for input_file in filter(None, input_files):
+        try:
+            output_file = convert_to_parquet(input_file, dtype=CSV_DTYPES)
+        except Exception as e:
+            console.print(f"[red]❌ Erro ao converter {input_file}: {e}[/red]")
+            return 1
+        console.print(f"[green]✅ {input_file} → {output_file}[/green]")
+
+    return 0
+
+
 def main():
     """Função principal do programa"""
     parser = argparse.ArgumentParser(
@@ -101,16 +130,18 @@ Exemplos de uso:
   %(prog)s --samples-json --auto-export
   %(prog)s --firewall logs.csv --auth auth.csv --export-csv relatorio.csv
   %(prog)s --samples --brute-force-threshold 3 --port-scan-threshold 5
+  %(prog)s --firewall logs.csv --convert-to-parquet
+  %(prog)s --samples --quiet --json-out relatorio.json
         """,
     )
 
     # Argumentos de entrada
     input_group = parser.add_argument_group("Arquivos de Entrada")
     input_group.add_argument(
-        "--firewall", type=str, help="Arquivo CSV/JSON com logs de firewall"
+        "--firewall", type=str, help="Arquivo CSV/JSON/Parquet com logs de firewall"
     )
     input_group.add_argument(
-        "--auth", type=str, help="Arquivo CSV/JSON com logs de autenticação"
+        "--auth", type=str, help="Arquivo CSV/JSON/Parquet com logs de autenticação"
     )
     input_group.add_argument(
         "--samples", action="store_true", help="Usar arquivos de exemplo (CSV)"
@@ -118,6 +149,11 @@ Exemplos de uso:
     input_group.add_argument(
         "--samples-json", action="store_true", help="Usar arquivos de exemplo (JSON)"
     )
+    input_group.add_argument(
+        "--convert-to-parquet",
+        action="store_true",
+        help="Converter os arquivos de entrada para Parquet (requer pyarrow) e sair",
+    )
 
     # Parâmetros de detecção
     detection_group = parser.add_argument_group("Parâmetros de Detecção")
@@ -173,6 +209,17 @@ Exemplos de uso:
         action="store_true",
         help="Exportar automaticamente para exports/suspect_ips.csv",
     )
+    export_group.add_argument(
+        "--json-out",
+        type=str,
+        default=None,
+        help="Salvar o relatório da análise em JSON no caminho informado",
+    )
+    export_group.add_argument(
+        "--quiet",
+        action="store_true",
+        help="Não exibir tabelas e painéis (evita a renderização em logs grandes)",
+    )
 
     args = parser.parse_args()
 
@@ -180,6 +227,13 @@ Exemplos de uso:
     if not validate_arguments(args):
         sys.exit(1)
 
+    if args.convert_to_parquet:
+        sys.exit(convert_inputs_to_parquet(args))
+
+    # core e utils (pandas, requests) só são importados após interpretar os
+    # argumentos: `--help` e erros de uso não pagam esse custo
+    from .core import LogAnalyzer
+
     # Configurar diretório de exportação
     exports_dir = setup_export_directory()
 
@@ -197,7 +251,8 @@ Exemplos de uso:
             }
         )
 
-        analyzer = LogAnalyzer(config=custom_config)
+        analyzer = LogAnalyzer(config=custom_config, quiet=args.quiet)
+        console.quiet = args.quiet
 
         # Exibir cabeçalho
         console.print(
@@ -241,14 +296,22 @@ Exemplos de uso:
         console.print("[bold green]🔍 INICIANDO ANÁLISE DE SEGURANÇA...[/bold green]")
         console.print()
 
+        # Filtrar uma vez as tentativas negadas/falhadas, usadas tanto na
+        # análise quanto na detecção
+        denied_firewall = failed_auth = None
+        if df_firewall is not None and not df_firewall.empty:
+            denied_firewall = analyzer.filter_denied_attempts(df_firewall)
+        if df_auth is not None and not df_auth.empty:
+            failed_auth = analyzer.filter_failed_attempts(df_auth)
+
         # Executar análises
         if df_firewall is not None:
             console.print("[blue]📊 Analisando logs de firewall...[/blue]")
-            analyzer.analyze_firewall_logs(df_firewall)
+            analyzer.analyze_firewall_logs(df_firewall, denied_firewall)
 
         if df_auth is not None:
             console.print("[blue]🔐 Analisando tentativas de autenticação...[/blue]")
-            analyzer.analyze_auth_logs(df_auth)
+            analyzer.analyze_auth_logs(df_auth, failed_auth)
 
         console.print("[blue]🌐 Contando acessos por IP...[/blue]")
         analyzer.count_access_by_ip(df_firewall, df_auth)
@@ -258,7 +321,10 @@ Exemplos de uso:
                 f"[blue]⚡ Detectando ataques de brute force ({args.brute_force_threshold}+ tentativas em {args.time_window} min)...[/blue]"
             )
             analyzer.detect_brute_force(
-                df_auth, args.time_window, args.brute_force_threshold
+                df_auth,
+                args.time_window,
+                args.brute_force_threshold,
+                failed_attempts=failed_auth,
             )
 
         if df_firewall is not None:
@@ -266,7 +332,10 @@ Exemplos de uso:
                 f"[blue]🔍 Detectando varreduras de portas ({args.port_scan_threshold}+ portas em {args.port_scan_window} min)...[/blue]"
             )
             analyzer.detect_port_scanning(
-                df_firewall, args.port_scan_window, args.port_scan_threshold
+                df_firewall,
+                args.port_scan_window,
+                args.port_scan_threshold,
+                denied_attempts=denied_firewall,
             )
 
         # Análise geográfica
@@ -274,12 +343,7 @@ Exemplos de uso:
             console.print(
                 "[blue]🌍 Executando análise geográfica dos IPs suspeitos...[/blue]"
             )
-            analyzer.analyze_geographic_patterns(
-                pd.concat(
-                    [df for df in [df_firewall, df_auth] if df is not None],
-                    ignore_index=True,
-                )
-            )
+            analyzer.analyze_geographic_patterns()
         elif args.disable_geo:
             console.print(
                 "[yellow]⏭️  Análise geográfica desabilitada pelo usuário[/yellow]"
@@ -307,13 +371,36 @@ Exemplos de uso:
 
             analyzer.export_suspect_ips_csv(str(output_file))
 
+        if args.json_out:
+            # Sempre JSON, no caminho informado (export_results escolhe o
+            # formato pela extensão)
+            try:
+                with open(args.json_out, "w", encoding="utf-8") as f:
+                    json.dump(
+                        analyzer.get_report(),
+                        f,
+                        indent=2,
+                        ensure_ascii=False,
+                        default=str,
+                    )
+            except OSError as e:
+                console.quiet = False
+                console.print(
+                    f"[red]❌ Não foi possível salvar o relatório {args.json_out}: {e}[/red]"
+                )
+                sys.exit(1)
+
+            console.print(f"[green]📄 Relatório JSON salvo: {args.json_out}[/green]")
+
         console.print()
         console.print("[bold green]✅ Análise concluída com sucesso![/bold green]")
 
     except KeyboardInterrupt:
+        console.quiet = False
         console.print("\n[yellow]⚠️  Análise interrompida pelo usuário[/yellow]")
         sys.exit(0)
     except Exception as e:
+        console.quiet = False
         console.print(f"\n[red]❌ Erro durante análise: {e}[/red]")
         if "--debug" in sys.argv:
             raise
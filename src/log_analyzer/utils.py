@@ -2,6 +2,7 @@
 Utilitários do Log Analyzer
 """
 
+import importlib.util
 import json
 import logging
 import os
@@ -13,6 +14,9 @@ import pandas as pd
 
 from .config import DEFAULT_CONFIG, SUPPORTED_DATE_FORMATS
 
+# Leitor de CSV colunar (Arrow) e multithread, usado quando disponível
+PYARROW_AVAILABLE = importlib.util.find_spec("pyarrow") is not None
+
 
 def setup_logging(config: Dict[str, Any] = None) -> logging.Logger:
     """
@@ -44,7 +48,7 @@ def validate_file_format(file_path: str) -> str:
         file_path: Caminho para o arquivo
 
     Returns:
-        Formato do arquivo ('csv' ou 'json')
+        Formato do arquivo ('csv', 'json' ou 'parquet')
 
     Raises:
         FileNotFoundError: Se o arquivo não existir
@@ -57,19 +61,85 @@ def validate_file_format(file_path: str) -> str:
 
     if file_extension == ".csv":
         return "csv"
-    elif file_extension == ".json":
+    elif file_extension in (".json", ".jsonl"):
         return "json"
+    elif file_extension == ".parquet":
+        return "parquet"
     else:
         raise ValueError(f"Formato de arquivo não suportado: {file_extension}")
 
 
-def load_data_file(file_path: str) -> pd.DataFrame:
+def _is_json_lines(file_path: str) -> bool:
     """
-    Carrega arquivo de dados (CSV ou JSON)
+    Verifica se o arquivo JSON está no formato JSON Lines (um objeto por linha)
 
     Args:
         file_path: Caminho para o arquivo
 
+    Returns:
+        True se as duas primeiras linhas forem, cada uma, um objeto JSON
+    """
+    with open(file_path, "r", encoding="utf-8") as f:
+        first_line = f.readline().strip()
+        second_line = ""
+        for line in f:
+            second_line = line.strip()
+            if second_line:
+                break
+
+    try:
+        record = json.loads(first_line)
+        next_record = json.loads(second_line) if second_line else None
+    except ValueError:
+        return False
+
+    if not isinstance(record, dict):
+        return False
+
+    if second_line:
+        return isinstance(next_record, dict)
+
+    # Com uma única linha, só é um registro se não houver valores aninhados:
+    # {"ip": [...], ...} ou {"metadata": {...}, "logs": [...]} em uma linha são
+    # documentos JSON comuns
+    return not any(isinstance(value, (dict, list)) for value in record.values())
+
+
+def _read_csv(file_path: str, dtype: Optional[Dict[str, Any]] = None) -> pd.DataFrame:
+    """
+    Lê um CSV com o motor Arrow (multithread) quando disponível
+
+    Args:
+        file_path: Caminho para o arquivo
+        dtype: Tipos por coluna (colunas ausentes no arquivo são ignoradas)
+
+    Returns:
+        DataFrame com os dados do CSV
+    """
+    if PYARROW_AVAILABLE:
+        try:
+            return pd.read_csv(file_path, dtype=dtype, engine="pyarrow")
+        except Exception:
+            # O motor Arrow é mais estrito (ex.: linhas com menos campos);
+            # nesses casos o leitor padrão decide se o arquivo é válido
+            pass
+
+    return pd.read_csv(file_path, dtype=dtype)
+
+
+def load_data_file(
+    file_path: str,
+    chunksize: int = 100_000,
+    dtype: Optional[Dict[str, Any]] = None,
+) -> pd.DataFrame:
+    """
+    Carrega arquivo de dados (CSV, JSON, JSON Lines ou Parquet)
+
+    Args:
+        file_path: Caminho para o arquivo
+        chunksize: Registros lidos por bloco em arquivos JSON Lines
+        dtype: Tipos por coluna aplicados na leitura de CSV
+
     Returns:
         DataFrame com os dados carregados
 
@@ -80,7 +150,21 @@ def load_data_file(file_path: str) -> pd.DataFrame:
 
     try:
         if file_format == "csv":
-            df = pd.read_csv(file_path)
+            df = _read_csv(file_path, dtype=dtype)
+        elif file_format == "parquet":
+            # Colunas com dictionary encoding já voltam como "category"
+            df = pd.read_parquet(file_path)
+        elif _is_json_lines(file_path):
+            # JSON Lines é lido em blocos, sem carregar o texto inteiro e a
+            # lista de dicts em memória ao mesmo tempo
+            reader = pd.read_json(
+                file_path,
+                lines=True,
+                chunksize=chunksize,
+                dtype=False,
+                convert_dates=False,
+            )
+            df = pd.concat(reader, ignore_index=True)
         else:  # json
             with open(file_path, "r", encoding="utf-8") as f:
                 json_data = json.load(f)
@@ -92,6 +176,36 @@ def load_data_file(file_path: str) -> pd.DataFrame:
         raise Exception(f"Erro ao carregar arquivo {file_path}: {str(e)}")
 
 
+def convert_to_parquet(
+    file_path: str,
+    output_path: Optional[str] = None,
+    dtype: Optional[Dict[str, Any]] = None,
+) -> str:
+    """
+    Converte um arquivo de logs (CSV/JSON) para Parquet
+
+    Colunas em ``dtype`` como "category" são gravadas com dictionary
+    encoding, e as próximas cargas leem o arquivo colunar sem reinterpretar
+    texto. Requer pyarrow.
+
+    Args:
+        file_path: Caminho para o arquivo de origem
+        output_path: Caminho do Parquet (padrão: mesmo nome com .parquet)
+        dtype: Tipos por coluna aplicados antes da gravação
+
+    Returns:
+        Caminho do arquivo Parquet gerado
+    """
+    df = load_data_file(file_path, dtype=dtype)
+    df = df.astype({col: kind for col, kind in (dtype or {}).items() if col in df})
+
+    if output_path is None:
+        output_path = str(Path(file_path).with_suffix(".parquet"))
+
+    df.to_parquet(output_path, compression="zstd", index=False)
+    return output_path
+
+
 def parse_timestamp(timestamp_str: str) -> Optional[datetime]:
     """
     Converte string de timestamp para datetime
@@ -6,6 +6,7 @@ para todos os testes da suíte de testes.
 """
 
 import os
+import sys
 
 import pytest
 import requests
@@ -22,6 +23,15 @@ def pytest_configure(config):
     config.addinivalue_line("markers", "unit: marca testes unitários")
 
 
+@pytest.fixture(autouse=True)
+def isolated_ip_cache(monkeypatch):
+    """Impede que os testes leiam ou gravem o cache SQLite de geolocalização."""
+    # O pacote é importado tanto como log_analyzer quanto como src.log_analyzer
+    for name, module in list(sys.modules.items()):
+        if name.endswith("log_analyzer.config"):
+            monkeypatch.setitem(module.DEFAULT_CONFIG["geographic"], "cache_file", None)
+
+
 @pytest.fixture(scope="session")
 def api_base_url():
     """Fixture que retorna a URL base da API."""
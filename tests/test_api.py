@@ -6,6 +6,7 @@ Este módulo contém testes robustos para todos os endpoints da API FastAPI,
 utilizando TestClient para testes de integração completos.
 """
 
+import gzip
 import io
 import json
 import tempfile
@@ -500,6 +501,104 @@ class TestEndpointMetrics:
         assert isinstance(metrics["requests_per_second"], (int, float))
 
 
+class TestGzipRequestBody:
+    """Testes para uploads com corpo compactado (Content-Encoding: gzip)."""
+
+    def test_analyze_accepts_gzip_encoded_body(
+        self, client: TestClient, firewall_csv_content: str
+    ):
+        """
+        Um multipart compactado com gzip deve ser descompactado pelo middleware
+        e processado como um upload comum.
+        """
+        token = client.post(
+            "/token", data={"username": "admin", "password": "senha123"}
+        ).json()["access_token"]
+
+        boundary = "test-boundary"
+        body = (
+            f"--{boundary}\r\n"
+            'Content-Disposition: form-data; name="firewall_log"; '
+            'filename="test_firewall.csv"\r\n'
+            "Content-Type: text/csv\r\n\r\n"
+            f"{firewall_csv_content}\r\n"
+            f"--{boundary}--\r\n"
+        ).encode()
+
+        response = client.post(
+            "/analyze/",
+            content=gzip.compress(body),
+            headers={
+                "Authorization": f"Bearer {token}",
+                "Content-Type": f"multipart/form-data; boundary={boundary}",
+                "Content-Encoding": "gzip",
+            },
+        )
+        assert response.status_code == 200
+
+        summary = response.json()["summary"]
+        assert summary["files_processed"] == 1
+        assert summary["total_events"] == 5
+
+    def test_analyze_rejects_gzip_body_over_limit(
+        self, client: TestClient, monkeypatch
+    ):
+        """
+        Um corpo compactado que se expande além de MAX_FILE_SIZE deve ser
+        recusado com 413, antes da autenticação e sem ser expandido inteiro.
+        """
+        monkeypatch.setattr("src.log_analyzer.api.MAX_FILE_SIZE", 64 * 1024)
+
+        boundary = "test-boundary"
+        body = (
+            f"--{boundary}\r\n"
+            'Content-Disposition: form-data; name="firewall_log"; '
+            'filename="bomb.csv"\r\n'
+            "Content-Type: text/csv\r\n\r\n"
+        ).encode() + b"0" * (10 * 1024 * 1024)
+        compressed = gzip.compress(body)
+        assert len(compressed) < 64 * 1024
+
+        response = client.post(
+            "/analyze/",
+            content=compressed,
+            headers={
+                "Content-Type": f"multipart/form-data; boundary={boundary}",
+                "Content-Encoding": "gzip",
+            },
+        )
+        assert response.status_code == 413, response.text
+
+
+class TestTruncatedUpload:
+    """Testes para uploads parciais (cabeçalho X-Log-Truncated-Bytes)."""
+
+    def test_analyze_records_truncated_bytes(
+        self, client: TestClient, firewall_csv_content: str
+    ):
+        """A truncagem informada pelo cliente deve constar no resumo."""
+        token = client.post(
+            "/token", data={"username": "admin", "password": "senha123"}
+        ).json()["access_token"]
+
+        response = client.post(
+            "/analyze/",
+            files={
+                "firewall_log": (
+                    "test_firewall.csv",
+                    io.BytesIO(firewall_csv_content.encode()),
+                    "text/csv",
+                )
+            },
+            headers={
+                "Authorization": f"Bearer {token}",
+                "X-Log-Truncated-Bytes": "1048576",
+            },
+        )
+        assert response.status_code == 200
+        assert response.json()["summary"]["truncated_bytes"] == 1048576
+
+
 class TestErrorHandling:
     """Testes para tratamento de erros da API."""
 
@@ -0,0 +1,139 @@
+"""
+Testes para o módulo cache_system.py
+"""
+
+import json
+from unittest.mock import patch
+
+from log_analyzer.cache_system import HybridCache, MemoryCache, RedisCache
+
+
+class StubRedis:
+    """Cliente Redis em memória, com os comandos usados pelo RedisCache"""
+
+    def __init__(self):
+        self.data = {}
+        self.mget_calls = []
+
+    def get(self, key):
+        return self.data.get(key)
+
+    def setex(self, key, ttl, value):
+        self.data[key] = value
+
+    def mget(self, keys):
+        self.mget_calls.append(list(keys))
+        return [self.data.get(key) for key in keys]
+
+    def pipeline(self):
+        return StubPipeline(self)
+
+    def delete(self, key):
+        self.data.pop(key, None)
+
+    def flushdb(self):
+        self.data.clear()
+
+
+class StubPipeline:
+    """Pipeline que só aplica os comandos em execute()"""
+
+    def __init__(self, redis):
+        self.redis = redis
+        self.commands = []
+
+    def setex(self, key, ttl, value):
+        self.commands.append((key, ttl, value))
+
+    def execute(self):
+        for command in self.commands:
+            self.redis.setex(*command)
+        self.commands = []
+
+
+class TestMemoryCacheBatch:
+    """Testes para MemoryCache.mget/mset"""
+
+    def test_mget_keeps_key_order(self):
+        """Testa que mget devolve os valores na ordem das chaves, com None nas faltas"""
+        cache = MemoryCache()
+        cache.mset({"a": 1, "b": 2, "c": 3})
+
+        assert cache.mget(["c", "x", "a", "b"]) == [3, None, 1, 2]
+        assert cache.stats()["hit_ratio"] == 0.75
+
+    def test_mget_expires_entries(self):
+        """Testa que entradas expiradas são removidas e retornam None"""
+        cache = MemoryCache(ttl_seconds=10)
+        with patch("log_analyzer.cache_system.time.time", return_value=1000.0):
+            cache.mset({"a": 1, "b": 2})
+        with patch("log_analyzer.cache_system.time.time", return_value=1005.0):
+            cache.set("b", 3)
+
+        with patch("log_analyzer.cache_system.time.time", return_value=1011.0):
+            assert cache.mget(["a", "b"]) == [None, 3]
+
+        assert cache.stats()["size"] == 1
+
+    def test_mset_evicts_least_recently_used(self):
+        """Testa que mset remove os itens menos usados além de max_size"""
+        cache = MemoryCache(max_size=3)
+        cache.mset({"a": 1, "b": 2, "c": 3})
+        cache.mget(["a"])
+
+        cache.mset({"d": 4, "e": 5})
+
+        assert cache.stats()["size"] == 3
+        assert cache.mget(["a", "b", "c", "d", "e"]) == [1, None, None, 4, 5]
+
+
+class TestRedisCacheBatch:
+    """Testes para RedisCache.mget/mset"""
+
+    def test_mset_and_mget_round_trip(self):
+        """Testa que mset grava via pipeline e mget lê na ordem das chaves"""
+        redis = StubRedis()
+        cache = RedisCache(redis_client=redis, ttl_seconds=60)
+
+        cache.mset({"a": {"ip": "10.0.0.1"}, "b": [1, 2]})
+
+        assert json.loads(redis.data["a"]) == {"ip": "10.0.0.1"}
+        assert cache.mget(["b", "x", "a"]) == [[1, 2], None, {"ip": "10.0.0.1"}]
+
+    def test_unavailable_returns_none_for_each_key(self):
+        """Testa mget sem cliente Redis configurado"""
+        cache = RedisCache(redis_client=None)
+
+        cache.mset({"a": 1})
+
+        assert cache.mget(["a", "b"]) == [None, None]
+
+
+class TestHybridCacheBatch:
+    """Testes para HybridCache.mget/mset"""
+
+    def test_mget_promotes_l2_hits_to_memory(self):
+        """Testa que faltas na memória são buscadas no Redis e promovidas"""
+        redis = StubRedis()
+        cache = HybridCache(MemoryCache(), RedisCache(redis_client=redis))
+        cache.memory_cache.set("a", 1)
+        redis.setex("b", 60, json.dumps(2))
+
+        assert cache.mget(["a", "b", "c"]) == [1, 2, None]
+        assert redis.mget_calls == [["b", "c"]]
+        assert cache.memory_cache.get("b") == 2
+
+        stats = cache.stats()
+        assert stats["hit_count"] == 2
+        assert stats["miss_count"] == 1
+
+    def test_mget_all_in_memory_skips_redis(self):
+        """Testa que o Redis não é consultado quando tudo está na memória"""
+        redis = StubRedis()
+        cache = HybridCache(MemoryCache(), RedisCache(redis_client=redis))
+
+        cache.mset({"a": 1, "b": 2})
+
+        assert cache.mget(["b", "a"]) == [2, 1]
+        assert redis.mget_calls == []
+        assert json.loads(redis.data["a"]) == 1
@@ -6,10 +6,11 @@ import json
 from pathlib import Path
 from unittest.mock import MagicMock, Mock, patch
 
+import numpy as np
 import pandas as pd
 import pytest
 
-from log_analyzer.core import LogAnalyzer
+from log_analyzer.core import LogAnalyzer, _first_dense_windows_numpy
 
 
 class TestLogAnalyzer:
@@ -101,6 +102,127 @@ class TestAnalyzeBruteForce:
         assert len(result) == 0
 
 
+class TestDetectBruteForce:
+    """Testes para detect_brute_force (janela deslizante por IP)"""
+
+    def test_detects_first_window_per_ip(self):
+        """Testa que só a primeira janela com tentativas suficientes é reportada"""
+        data = pd.DataFrame(
+            {
+                "timestamp": [
+                    "2024-01-01 10:00:00",
+                    "2024-01-01 10:05:00",
+                    "2024-01-01 10:05:20",
+                    "2024-01-01 10:05:40",
+                    "2024-01-01 10:06:00",
+                    "2024-01-01 10:06:30",
+                    "2024-01-01 10:00:10",
+                ],
+                "source_ip": ["10.0.0.1"] * 6 + ["10.0.0.2"],
+                "status": ["FAILED"] * 7,
+                "username": ["admin", "admin", "root", "admin", "root", "admin", "a"],
+                "service": ["ssh"] * 7,
+            }
+        )
+
+        analyzer = LogAnalyzer()
+        analyzer.detect_brute_force(data, time_window_minutes=1, threshold=4)
+
+        assert len(analyzer.brute_force_attempts) == 1
+        attack = analyzer.brute_force_attempts[0]
+        assert attack["ip"] == "10.0.0.1"
+        assert attack["start_time"] == pd.Timestamp("2024-01-01 10:05:00")
+        assert attack["end_time"] == pd.Timestamp("2024-01-01 10:06:00")
+        assert attack["attempts"] == 4
+        assert attack["duration"] == 60
+        assert attack["users_targeted"] == ["admin", "root"]
+
+    def test_filter_is_not_reused_after_in_place_change(self):
+        """Testa que alterar o DataFrame entre análise e detecção é respeitado"""
+        data = pd.DataFrame(
+            {
+                "timestamp": [f"2024-01-01 10:00:{s:02d}" for s in range(4)],
+                "source_ip": ["10.0.0.1"] * 4,
+                "status": ["FAILED"] * 4,
+                "username": ["admin"] * 4,
+                "service": ["ssh"] * 4,
+            }
+        )
+
+        analyzer = LogAnalyzer(quiet=True)
+        analyzer.analyze_auth_logs(data)
+        data["status"] = "SUCCESS"
+        analyzer.detect_brute_force(data, time_window_minutes=1, threshold=4)
+
+        assert analyzer.brute_force_attempts == []
+
+        failed_attempts = LogAnalyzer.filter_failed_attempts(
+            data.assign(status="FAILED")
+        )
+        analyzer.detect_brute_force(
+            data, time_window_minutes=1, threshold=4, failed_attempts=failed_attempts
+        )
+
+        assert len(analyzer.brute_force_attempts) == 1
+
+
+class TestFirstDenseWindows:
+    """Testes para os kernels de janela deslizante (Numba x NumPy)"""
+
+    def test_numba_kernel_matches_numpy(self):
+        """Testa que o kernel Numba retorna as mesmas janelas que o NumPy"""
+        pytest.importorskip("numba")
+        from log_analyzer._kernels import first_dense_windows
+
+        rng = np.random.default_rng(42)
+        # Grupos vazios, menores que min_count e grandes
+        sizes = rng.integers(0, 40, size=200)
+        timestamps = np.concatenate(
+            [np.sort(rng.integers(0, 600, size=n)) for n in sizes]
+        ).astype(np.int64) * np.int64(1_000_000_000)
+        group_starts = np.concatenate([[0], np.cumsum(sizes)]).astype(np.int64)
+        window_ns = np.int64(60 * 1_000_000_000)
+
+        for min_count in (1, 5, 10):
+            expected = _first_dense_windows_numpy(
+                timestamps, group_starts, window_ns, min_count
+            )
+            actual = first_dense_windows(timestamps, group_starts, window_ns, min_count)
+
+            np.testing.assert_array_equal(actual[0], expected[0])
+            np.testing.assert_array_equal(actual[1], expected[1])
+        assert (expected[0] >= 0).any() and (expected[0] < 0).any()
+
+
+class TestDetectPortScanning:
+    """Testes para detect_port_scanning"""
+
+    def test_detects_scan_only_within_window(self):
+        """Testa que só IPs com portas suficientes dentro da janela são reportados"""
+        data = pd.DataFrame(
+            {
+                "timestamp": [f"2024-01-01 10:00:{s:02d}" for s in range(0, 50, 10)]
+                + ["2024-01-01 10:00:00", "2024-01-01 10:05:00"] * 3,
+                "source_ip": ["10.0.0.1"] * 5 + ["10.0.0.2"] * 6,
+                "destination_ip": ["10.0.0.100"] * 11,
+                "port": [21, 22, 23, 25, 22] + [80, 81, 82, 83, 84, 85],
+                "protocol": ["TCP"] * 11,
+                "action": ["DENY"] * 11,
+            }
+        )
+
+        analyzer = LogAnalyzer()
+        analyzer.detect_port_scanning(data, time_window_minutes=1, min_ports=4)
+
+        assert len(analyzer.port_scan_attempts) == 1
+        scan = analyzer.port_scan_attempts[0]
+        assert scan["ip"] == "10.0.0.1"
+        assert scan["unique_ports"] == 4
+        assert scan["ports_scanned"] == [21, 22, 23, 25]
+        assert scan["total_attempts"] == 5
+        assert scan["duration"] == 40
+
+
 class TestGenerateStatistics:
     """Testes para geração de estatísticas"""
 
@@ -285,3 +407,53 @@ class TestIntegration:
         output_file = exports_path / "integration_test.json"
         export_success = analyzer.export_results(str(output_file), stats)
         assert isinstance(export_success, bool)
+
+
+class TestReport:
+    """Testes para o modo silencioso e o relatório em JSON"""
+
+    def test_quiet_analyzer_renders_nothing(self, capsys):
+        """Testa que o modo silencioso não imprime tabelas"""
+        analyzer = LogAnalyzer(quiet=True)
+        df = pd.DataFrame(
+            {
+                "timestamp": ["2024-01-01 10:00:00", "2024-01-01 10:00:01"],
+                "source_ip": ["192.168.1.100", "192.168.1.101"],
+            }
+        )
+
+        analyzer.count_access_by_ip(df, None)
+
+        assert capsys.readouterr().out == ""
+        assert analyzer.ip_access_count["192.168.1.100"] == 1
+
+    def test_get_report_is_json_serializable(self, exports_path):
+        """Testa exportação do relatório da análise em JSON"""
+        analyzer = LogAnalyzer(quiet=True)
+        analyzer.count_access_by_ip(
+            pd.DataFrame({"source_ip": ["10.0.0.1", "10.0.0.1", "10.0.0.2"]}), None
+        )
+
+        output_file = exports_path / "report.json"
+        assert analyzer.export_results(str(output_file), analyzer.get_report())
+
+        report = json.loads(output_file.read_text(encoding="utf-8"))
+        assert report["top_ips"][0] == {"ip": "10.0.0.1", "count": 2}
+        assert report["summary"]["failed_logins"] == 0
+
+
+class TestGeographicPatterns:
+    """Testes para a análise geográfica a partir do LogAnalyzer"""
+
+    def test_only_suspect_ips_are_geolocated(self):
+        """Testa que apenas IPs do registro de suspeitos são analisados"""
+        analyzer = LogAnalyzer(quiet=True)
+        medium = analyzer.config["risk_classification"]["medium_threshold"]
+        analyzer.ip_access_count.update({"10.0.0.1": medium, "10.0.0.2": 1})
+
+        with patch(
+            "log_analyzer.core.GeographicAnalyzer.analyze_geographic_patterns"
+        ) as mock_analyze:
+            analyzer.analyze_geographic_patterns()
+
+        mock_analyze.assert_called_once_with({"10.0.0.1"})
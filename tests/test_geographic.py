@@ -2,11 +2,14 @@
 Testes para o módulo geographic.py
 """
 
+import time
 from unittest.mock import MagicMock, Mock, patch
 
 import pandas as pd
 import pytest
+import requests
 
+from log_analyzer.config import DEFAULT_CONFIG
 from log_analyzer.geographic import GeographicAnalyzer
 
 
@@ -41,7 +44,7 @@ class TestGeographicAnalyzer:
 class TestGetIpLocation:
     """Testes para get_ip_location"""
 
-    @patch("requests.get")
+    @patch("requests.Session.get")
     def test_get_valid_ip_location(self, mock_get):
         """Testa busca de localização para IP válido"""
         # Mock da resposta da API
@@ -75,7 +78,7 @@ class TestGetIpLocation:
             result = analyzer.get_ip_location(ip)
             assert result is None
 
-    @patch("requests.get")
+    @patch("requests.Session.get")
     def test_api_request_failure(self, mock_get):
         """Testa falha na requisição da API"""
         mock_get.side_effect = Exception("Connection error")
@@ -89,8 +92,9 @@ class TestGetIpLocation:
 class TestAnalyzeIps:
     """Testes para analyze_ips"""
 
+    @patch.object(GeographicAnalyzer, "_batch_geolocate")
     @patch.object(GeographicAnalyzer, "get_ip_location")
-    def test_analyze_valid_ips(self, mock_get_location):
+    def test_analyze_valid_ips(self, mock_get_location, mock_batch):
         """Testa análise de IPs válidos"""
         # Mock das respostas de localização
         mock_get_location.return_value = {
@@ -109,8 +113,9 @@ class TestAnalyzeIps:
         assert results is not None
         assert len(results) == 2
 
+    @patch.object(GeographicAnalyzer, "_batch_geolocate")
     @patch.object(GeographicAnalyzer, "get_ip_location")
-    def test_analyze_private_ips(self, mock_get_location):
+    def test_analyze_private_ips(self, mock_get_location, mock_batch):
         """Testa análise com IPs privados"""
         mock_get_location.return_value = None
 
@@ -123,6 +128,64 @@ class TestAnalyzeIps:
         assert isinstance(results, list)
 
 
+class TestBatchGeolocate:
+    """Testes para consulta de geolocalização em lote"""
+
+    @patch("requests.Session.post")
+    def test_batch_fills_cache_in_one_request(self, mock_post):
+        """Testa que vários IPs são resolvidos com uma única requisição"""
+        mock_response = Mock()
+        mock_response.json.return_value = [
+            {"status": "success", "query": "8.8.8.8", "country": "United States"},
+            {"status": "fail", "query": "203.0.113.5", "message": "reserved range"},
+        ]
+        mock_post.return_value = mock_response
+
+        analyzer = GeographicAnalyzer()
+        analyzer._batch_geolocate(["8.8.8.8", "192.168.1.1", "203.0.113.5", "8.8.8.8"])
+
+        assert mock_post.call_count == 1
+        assert mock_post.call_args.kwargs["json"] == ["8.8.8.8", "203.0.113.5"]
+        assert analyzer.ip_location_cache["8.8.8.8"]["country"] == "United States"
+        assert analyzer.ip_location_cache["203.0.113.5"] is None
+        assert "192.168.1.1" not in analyzer.ip_location_cache
+
+    @patch("time.sleep")
+    @patch("requests.Session.post")
+    def test_batch_splits_by_batch_size(self, mock_post, mock_sleep):
+        """Testa divisão dos IPs em lotes de batch_size"""
+        mock_post.side_effect = lambda url, json, timeout: Mock(
+            json=Mock(return_value=[{"status": "success"} for _ in json])
+        )
+
+        analyzer = GeographicAnalyzer()
+        analyzer.batch_size = 2
+        analyzer._batch_geolocate(
+            ["1.1.1.1", "1.0.0.1", "8.8.8.8", "8.8.4.4", "9.9.9.9"]
+        )
+
+        assert mock_post.call_count == 3
+        assert mock_sleep.call_count == 2
+        assert len(analyzer.ip_location_cache) == 5
+
+    @patch("requests.Session.get")
+    @patch("requests.Session.post")
+    def test_batch_failure_falls_back_to_single_lookup(self, mock_post, mock_get):
+        """Testa que IPs não resolvidos no lote são consultados individualmente"""
+        mock_post.side_effect = requests.exceptions.ConnectionError("offline")
+        mock_get.return_value = Mock(
+            status_code=200,
+            json=Mock(return_value={"status": "success", "country": "Brazil"}),
+        )
+
+        analyzer = GeographicAnalyzer()
+        analyzer.rate_limit_delay = 0
+        results = analyzer.analyze_ips(["200.100.50.25"])
+
+        assert mock_get.call_count == 1
+        assert results[0]["country"] == "Brazil"
+
+
 class TestHighRiskDetection:
     """Testes para detecção de países de alto risco"""
 
@@ -149,7 +212,7 @@ class TestHighRiskDetection:
 class TestCaching:
     """Testes para cache de IPs"""
 
-    @patch("requests.get")
+    @patch("requests.Session.get")
     def test_ip_location_caching(self, mock_get):
         """Testa cache de localização de IPs"""
         # Mock da resposta da API
@@ -178,10 +241,80 @@ class TestCaching:
         assert "8.8.8.8" in analyzer.ip_location_cache
 
 
+class TestParallelLookup:
+    """Testes para consultas individuais em paralelo"""
+
+    @patch.object(GeographicAnalyzer, "_batch_geolocate")
+    @patch("requests.Session.get")
+    def test_locate_ips_keeps_order_and_rate_limit(self, mock_get, mock_batch):
+        """Testa ordem dos resultados e espaçamento mínimo entre requisições"""
+        mock_get.side_effect = lambda url, timeout: Mock(
+            status_code=200,
+            json=Mock(
+                return_value={"status": "success", "city": url.split("/")[-1][:7]}
+            ),
+        )
+        ips = ["1.1.1.1", "8.8.8.8", "192.168.0.1", "9.9.9.9", "8.8.8.8"]
+
+        analyzer = GeographicAnalyzer()
+        analyzer.rate_limit_delay = 0.05
+        start = time.monotonic()
+        results = analyzer.locate_ips(ips)
+        elapsed = time.monotonic() - start
+
+        assert mock_get.call_count == 3
+        assert elapsed >= 0.1
+        assert [r and r["city"] for r in results] == [
+            "1.1.1.1",
+            "8.8.8.8",
+            None,
+            "9.9.9.9",
+            "8.8.8.8",
+        ]
+
+
+class TestPersistentCache:
+    """Testes para o cache SQLite de localizações entre execuções"""
+
+    @staticmethod
+    def _config(cache_file, ttl_hours=24):
+        geo_config = dict(DEFAULT_CONFIG["geographic"])
+        geo_config.update(cache_file=str(cache_file), cache_ttl_hours=ttl_hours)
+        return {"geographic": geo_config}
+
+    @patch("requests.Session.get")
+    def test_locations_survive_new_instances(self, mock_get, tmp_path):
+        """Testa que uma nova instância reutiliza as localizações gravadas"""
+        mock_get.return_value = Mock(
+            status_code=200,
+            json=Mock(return_value={"status": "success", "country": "Brazil"}),
+        )
+        config = self._config(tmp_path / "ip_cache.db")
+
+        first = GeographicAnalyzer(config=config)
+        first.rate_limit_delay = 0
+        first.get_ip_location("200.100.50.25")
+
+        second = GeographicAnalyzer(config=config)
+        result = second.get_ip_location("200.100.50.25")
+
+        assert mock_get.call_count == 1
+        assert result["country"] == "Brazil"
+
+    def test_expired_entries_are_ignored(self, tmp_path):
+        """Testa que entradas mais antigas que o TTL não são carregadas"""
+        config = self._config(tmp_path / "ip_cache.db", ttl_hours=0)
+
+        analyzer = GeographicAnalyzer(config=config)
+        analyzer._persist_locations({"8.8.8.8": {"country": "United States"}})
+
+        assert GeographicAnalyzer(config=config).ip_location_cache == {}
+
+
 class TestErrorHandling:
     """Testes para tratamento de erros"""
 
-    @patch("requests.get")
+    @patch("requests.Session.get")
     def test_api_timeout(self, mock_get):
         """Testa timeout da API"""
         mock_get.side_effect = Exception("Timeout")
@@ -191,7 +324,7 @@ class TestErrorHandling:
 
         assert result is None
 
-    @patch("requests.get")
+    @patch("requests.Session.get")
     def test_api_rate_limit(self, mock_get):
         """Testa limite de taxa da API"""
         mock_response = Mock()
@@ -215,8 +348,9 @@ class TestErrorHandling:
 class TestIntegration:
     """Testes de integração para GeographicAnalyzer"""
 
+    @patch.object(GeographicAnalyzer, "_batch_geolocate")
     @patch.object(GeographicAnalyzer, "get_ip_location")
-    def test_complete_geographic_workflow(self, mock_get_location):
+    def test_complete_geographic_workflow(self, mock_get_location, mock_batch):
         """Testa fluxo completo de análise geográfica"""
         # Mock das respostas
         mock_locations = [
@@ -0,0 +1,45 @@
+"""
+Testes para a interface de linha de comando (main.py)
+"""
+
+import json
+import sys
+from unittest.mock import patch
+
+import pandas as pd
+
+from log_analyzer.main import main
+
+
+class TestJsonOut:
+    """Testes para a opção --json-out"""
+
+    def test_json_out_writes_json_regardless_of_extension(self, tmp_path):
+        """Testa que --json-out grava JSON mesmo em caminho sem .json"""
+        firewall_file = tmp_path / "fw.csv"
+        pd.DataFrame(
+            {
+                "timestamp": ["2024-01-01 10:00:00", "2024-01-01 10:00:05"],
+                "source_ip": ["10.0.0.1", "10.0.0.2"],
+                "destination_ip": ["10.0.0.100"] * 2,
+                "port": [22, 80],
+                "protocol": ["TCP"] * 2,
+                "action": ["DENY", "ALLOW"],
+            }
+        ).to_csv(firewall_file, index=False)
+        report_file = tmp_path / "report.txt"
+
+        argv = [
+            "log-analyzer",
+            "--firewall",
+            str(firewall_file),
+            "--disable-geo",
+            "--quiet",
+            "--json-out",
+            str(report_file),
+        ]
+        with patch.object(sys, "argv", argv):
+            main()
+
+        report = json.loads(report_file.read_text(encoding="utf-8"))
+        assert "summary" in report
@@ -11,8 +11,10 @@ import pandas as pd
 import pytest
 
 from log_analyzer.utils import (
+    _is_json_lines,
     calculate_risk_score,
     clean_ip_address,
+    convert_to_parquet,
     ensure_directory_exists,
     format_duration,
     generate_timestamped_filename,
@@ -115,6 +117,60 @@ class TestLoadDataFile:
         assert len(df) == 1
         assert "timestamp" in df.columns
 
+    def test_load_json_lines_file(self, tmp_path):
+        """Testa carregamento de arquivo JSON Lines em blocos"""
+        jsonl_file = tmp_path / "test.jsonl"
+        records = [
+            {"timestamp": f"2024-01-01 10:00:0{i}", "source_ip": "10.0.0.1", "port": i}
+            for i in range(5)
+        ]
+        jsonl_file.write_text("\n".join(json.dumps(r) for r in records) + "\n")
+
+        df = load_data_file(str(jsonl_file), chunksize=2)
+
+        assert len(df) == 5
+        assert df["port"].tolist() == [0, 1, 2, 3, 4]
+        assert df["timestamp"].iloc[0] == "2024-01-01 10:00:00"
+
+    def test_single_line_json_document_is_not_json_lines(self, tmp_path):
+        """Testa que um documento JSON em uma só linha não é lido como JSON Lines"""
+        json_file = tmp_path / "test.json"
+        document = {
+            "metadata": {"source": "firewall"},
+            "logs": [{"timestamp": "2024-01-01 10:00:00", "source_ip": "10.0.0.1"}],
+        }
+        json_file.write_text(json.dumps(document))
+
+        assert _is_json_lines(str(json_file)) is False
+
+    def test_single_record_json_lines_file(self, tmp_path):
+        """Testa que um arquivo JSON Lines com um só registro é detectado"""
+        jsonl_file = tmp_path / "test.jsonl"
+        record = {"timestamp": "2024-01-01 10:00:00", "source_ip": "10.0.0.1"}
+        jsonl_file.write_text(json.dumps(record) + "\n")
+
+        assert _is_json_lines(str(jsonl_file)) is True
+        assert len(load_data_file(str(jsonl_file))) == 1
+
+    def test_convert_and_load_parquet_file(self, tmp_path):
+        """Testa conversão de CSV para Parquet e carregamento do resultado"""
+        pytest.importorskip("pyarrow")
+        csv_file = tmp_path / "test.csv"
+        csv_file.write_text(
+            "timestamp,source_ip,action\n"
+            "2024-01-01 10:00:00,192.168.1.1,DENY\n"
+            "2024-01-01 10:00:01,192.168.1.2,ALLOW\n"
+        )
+
+        parquet_file = convert_to_parquet(str(csv_file), dtype={"action": "category"})
+        df = load_data_file(parquet_file)
+
+        assert parquet_file == str(tmp_path / "test.parquet")
+        assert validate_file_format(parquet_file) == "parquet"
+        assert len(df) == 2
+        assert df["source_ip"].tolist() == ["192.168.1.1", "192.168.1.2"]
+        assert isinstance(df["action"].dtype, pd.CategoricalDtype)
+
     def test_load_nonexistent_file(self):
         """Testa carregamento de arquivo inexistente"""
         with pytest.raises(Exception):